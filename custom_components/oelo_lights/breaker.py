@@ -0,0 +1,54 @@
+"""Circuit breaker for unreachable Oelo controllers."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+from .const import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_MAX_PROBE_INTERVAL,
+    CIRCUIT_PROBE_INTERVAL,
+)
+
+
+class OeloCircuitBreaker:
+    """Track consecutive failures of a controller.
+
+    The breaker opens after ``threshold`` consecutive failed requests. While
+    open, commands are rejected without contacting the controller and polls
+    act as probes whose interval doubles after every failure, up to
+    ``max_probe_interval``. The first successful request closes it again.
+    """
+
+    def __init__(
+        self,
+        threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        probe_interval: timedelta = CIRCUIT_PROBE_INTERVAL,
+        max_probe_interval: timedelta = CIRCUIT_MAX_PROBE_INTERVAL,
+    ) -> None:
+        """Initialize the breaker."""
+        self._threshold = max(1, threshold)
+        self._min_probe_interval = probe_interval
+        self._max_probe_interval = max_probe_interval
+        self.probe_interval = probe_interval
+        self.failures = 0
+        self.is_open = False
+
+    def record_success(self) -> bool:
+        """Record a successful request; return True if this closed the breaker."""
+        self.failures = 0
+        self.probe_interval = self._min_probe_interval
+        if not self.is_open:
+            return False
+        self.is_open = False
+        return True
+
+    def record_failure(self) -> bool:
+        """Record a failed request; return True if this opened the breaker."""
+        self.failures += 1
+        if self.is_open:
+            self.probe_interval = min(self.probe_interval * 2, self._max_probe_interval)
+            return False
+        if self.failures < self._threshold:
+            return False
+        self.is_open = True
+        return True
@@ -0,0 +1,72 @@
+"""Batch color transforms for Oelo Lights integration."""
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
+
+from .const import MAX_COLORS
+
+RGBColor = tuple[int, int, int]
+
+
+# One table per brightness and gamma, so a full slider sweep stays cached
+@lru_cache(maxsize=256)
+def _scale_table(brightness: int, gamma: float | None = None) -> tuple[int, ...]:
+    """Return the 256-entry lookup table for a brightness and gamma."""
+    factor = max(0, min(brightness, 255)) / 255.0
+    if gamma is None:
+        return tuple(max(0, min(int(round(v * factor)), 255)) for v in range(256))
+    return tuple(
+        max(0, min(int(round(255 * (v / 255) ** gamma * factor)), 255))
+        for v in range(256)
+    )
+
+
+def scale_colors(
+    colors: Iterable[Sequence[int]],
+    brightness: int = 255,
+    gamma: float | None = None,
+) -> tuple[RGBColor, ...]:
+    """Scale, optionally gamma-correct and clamp up to MAX_COLORS colors in one pass."""
+    table = _scale_table(brightness, gamma)
+    scaled: list[RGBColor] = []
+    for rgb in colors:
+        if len(scaled) == MAX_COLORS:
+            break
+        scaled.append((
+            table[max(0, min(int(rgb[0]), 255))],
+            table[max(0, min(int(rgb[1]), 255))],
+            table[max(0, min(int(rgb[2]), 255))],
+        ))
+    return tuple(scaled)
+
+
+def blend_colors(
+    start: Sequence[Sequence[int]],
+    end: Sequence[Sequence[int]],
+    fraction: float,
+) -> tuple[RGBColor, ...]:
+    """Interpolate between two color arrays, pairing colors by position.
+
+    The shorter array is padded with its last color so gradients of
+    different lengths can be blended.
+    """
+    count = min(max(len(start), len(end)), MAX_COLORS)
+    if not count:
+        return ()
+    fraction = max(0.0, min(fraction, 1.0))
+    blended: list[RGBColor] = []
+    for i in range(count):
+        a = start[min(i, len(start) - 1)] if start else end[i]
+        b = end[min(i, len(end) - 1)] if end else start[i]
+        blended.append((
+            int(round(a[0] + (b[0] - a[0]) * fraction)),
+            int(round(a[1] + (b[1] - a[1]) * fraction)),
+            int(round(a[2] + (b[2] - a[2]) * fraction)),
+        ))
+    return tuple(blended)
+
+
+def encode_colors(colors: Iterable[Sequence[int]]) -> str:
+    """Flatten colors into the comma-separated form used by setPattern."""
+    return ",".join(str(c) for rgb in colors for c in rgb)
@@ -11,9 +11,16 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_IP_ADDRESS
+from homeassistant.core import callback
 from homeassistant.helpers import aiohttp_client
 
-from .const import DEFAULT_TIMEOUT, DOMAIN
+from .const import (
+    CONF_MAX_SCAN_INTERVAL,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_TIMEOUT,
+    DOMAIN,
+    SCAN_INTERVAL,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,6 +45,14 @@ class OeloConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OeloOptionsFlow:
+        """Get the options flow for this handler."""
+        return OeloOptionsFlow(config_entry)
+
     async def _test_connection(self, ip: str) -> tuple[bool, str | None]:
         """Test connection to the Oelo controller."""
         session = aiohttp_client.async_get_clientsession(self.hass)
@@ -91,4 +106,32 @@ class OeloConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="user",
             data_schema=DATA_SCHEMA,
             errors=errors,
-        )
\ No newline at end of file
+        )
+
+
+class OeloOptionsFlow(config_entries.OptionsFlow):
+    """Handle Oelo Lights options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.ConfigFlowResult:
+        """Manage the polling options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        max_scan_interval = self._entry.options.get(
+            CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+        )
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema({
+                vol.Required(CONF_MAX_SCAN_INTERVAL, default=max_scan_interval): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=int(SCAN_INTERVAL.total_seconds()), max=3600),
+                ),
+            }),
+        )
@@ -3,19 +3,47 @@ from datetime import timedelta
 
 DOMAIN = "oelo_lights"
 
+# Options
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+
 # Polling and timing
 SCAN_INTERVAL = timedelta(seconds=30)
+FAST_SCAN_INTERVAL = timedelta(seconds=3)  # after an observed change
+COMMAND_SETTLE_DELAY = timedelta(seconds=3)  # before verifying a confirmed command
+FAST_SCAN_DURATION = 30  # seconds to keep polling fast
+DEFAULT_MAX_SCAN_INTERVAL = 300  # seconds, ceiling for backing off idle polls
 DEFAULT_TIMEOUT = 10  # seconds
-DEBOUNCE_INTERVAL = 1.0  # seconds
+PROBE_TIMEOUT = 3  # seconds, for polls while the circuit breaker is open
+CONNECT_TIMEOUT = 3  # seconds
+KEEPALIVE_TIMEOUT = 5  # seconds an idle controller connection is kept open
+DEBOUNCE_INTERVAL = 1.0  # seconds, upper bound of the adaptive debounce window
+DEBOUNCE_MIN_INTERVAL = 0.2  # seconds
+DEBOUNCE_RTT_MULTIPLIER = 2.0  # debounce window as a multiple of command RTT
+RTT_SMOOTHING = 0.3  # weight of the newest sample in the RTT moving average
+COMMAND_COALESCE_WINDOW = 0.05  # seconds
+TRANSITION_MIN_FRAME_INTERVAL = 0.2  # seconds
+TRANSITION_MAX_FRAME_INTERVAL = 1.0  # seconds
+TRANSITION_RTT_MULTIPLIER = 1.5  # frame interval as a multiple of command RTT
+MAX_CONCURRENT_REQUESTS = 1  # in-flight requests per controller
+FLEET_MAX_CONCURRENCY = 8  # controllers commanded at once by the fleet service
+METRICS_WINDOW_SIZE = 200  # latency samples kept for percentiles
+
+# Circuit breaker
+CIRCUIT_FAILURE_THRESHOLD = 3  # consecutive failed requests before opening
+CIRCUIT_PROBE_INTERVAL = timedelta(seconds=10)  # first retry after a failure
+CIRCUIT_MAX_PROBE_INTERVAL = timedelta(minutes=5)
 
 # Storage
 STORAGE_VERSION = 1
 STORAGE_KEY_BASE = f"{DOMAIN}_entity_data"
+STORAGE_SAVE_DELAY = 10  # seconds between batched writes
 
 # Light defaults
 DEFAULT_BRIGHTNESS = 255
 DEFAULT_COLOR = (255, 255, 255)
 MAX_COLORS = 20
+MAX_SPEED = 20
+MAX_GAP = 20
 NUM_ZONES = 6
 
 # Pattern types
@@ -2,24 +2,154 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field, replace
+from datetime import timedelta
+import itertools
 import logging
-from typing import Any
+import urllib.parse
+from typing import Any, NamedTuple
 
 import aiohttp
 
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util.json import json_loads
 
-from .const import DEFAULT_TIMEOUT, SCAN_INTERVAL
+from .breaker import OeloCircuitBreaker
+from .colors import RGBColor
+from .const import (
+    COMMAND_COALESCE_WINDOW,
+    COMMAND_SETTLE_DELAY,
+    DEBOUNCE_INTERVAL,
+    DEBOUNCE_MIN_INTERVAL,
+    DEBOUNCE_RTT_MULTIPLIER,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_TIMEOUT,
+    DOMAIN,
+    FAST_SCAN_DURATION,
+    FAST_SCAN_INTERVAL,
+    MAX_CONCURRENT_REQUESTS,
+    PATTERN_TYPE_OFF,
+    PROBE_TIMEOUT,
+    RTT_SMOOTHING,
+    SCAN_INTERVAL,
+    TRANSITION_MAX_FRAME_INTERVAL,
+    TRANSITION_MIN_FRAME_INTERVAL,
+    TRANSITION_RTT_MULTIPLIER,
+)
+from .dispatcher import (
+    PRIORITY_COMMAND,
+    PRIORITY_POLL,
+    CommandSuperseded,
+    OeloRequestDispatcher,
+)
+from .metrics import OeloMetrics
+from .protocol import SetPatternCommand
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class OeloDataUpdateCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
-    """Coordinator to manage fetching Oelo controller data."""
+def controller_device_info(entry: ConfigEntry, ip: str) -> DeviceInfo:
+    """Return the device info shared by every entity of a controller.
+
+    Whichever platform registers the device first names it, so every
+    platform passes the full info.
+    """
+    return DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id)},
+        name=entry.title,
+        manufacturer="Oelo",
+        model="Light Controller",
+        configuration_url=f"http://{ip}/",
+    )
+
+@dataclass(frozen=True, slots=True)
+class ZoneState:
+    """State of a single zone as reported by the controller."""
+
+    num: int
+    pattern: str | None
+    colors: tuple[RGBColor, ...] = ()
+    speed: int | None = None
+    gap: int | None = None
+    direction: str | None = None
+    raw: Mapping[str, Any] = field(default_factory=dict, compare=False, repr=False)
+
+    @classmethod
+    def from_dict(cls, item: dict[str, Any]) -> ZoneState:
+        """Parse a zone entry from a getController response."""
+        return cls(
+            num=item["num"],
+            pattern=item.get("pattern"),
+            colors=_parse_colors(item.get("colors", item.get("colorStr"))),
+            speed=_parse_int(item.get("speed")),
+            gap=_parse_int(item.get("gap")),
+            direction=item.get("direction"),
+            raw=item,
+        )
+
+    def to_command(self) -> SetPatternCommand | None:
+        """Return the command that reproduces this zone, if it can be rebuilt."""
+        if self.pattern == PATTERN_TYPE_OFF:
+            return SetPatternCommand.off()
+        if not self.pattern:
+            return None
+        try:
+            return SetPatternCommand(
+                self.pattern,
+                self.colors,
+                self.speed or 0,
+                self.gap or 0,
+                self.direction or "F",
+            )
+        except ValueError:
+            return None
+
+    def matches(self, command: SetPatternCommand) -> bool:
+        """Return True if the zone is running the given command."""
+        return (
+            self.pattern == command.pattern_type
+            and self.colors == command.colors
+            and self.speed in (None, command.speed)
+            and self.gap in (None, command.gap)
+        )
+
+
+class PreparedCommand(NamedTuple):
+    """A command with its request URL built, ready to be sent."""
+
+    zones: frozenset[int]
+    command: SetPatternCommand
+    url: str
+
+
+class OeloDataUpdateCoordinator(DataUpdateCoordinator[dict[int, ZoneState]]):
+    """Coordinator to manage fetching Oelo controller data.
+
+    Data is indexed by zone number so entities can look up their zone directly.
+    The polling interval adapts to activity. It drops to FAST_SCAN_INTERVAL
+    for FAST_SCAN_DURATION after a poll observes a change, and doubles
+    towards the configured ceiling while responses stay identical.
+
+    Failed requests feed a circuit breaker. Once it opens, commands fail
+    fast and polls become probes with exponential backoff; entities are
+    marked unavailable together until a probe succeeds.
+
+    Confirmed commands are applied to the cached zone state right away and
+    verified by a single poll after COMMAND_SETTLE_DELAY. Once verified, a
+    repeat of a zone's last acknowledged command is skipped unless forced.
+    """
 
     def __init__(
-        self, hass: HomeAssistant, session: aiohttp.ClientSession, ip: str
+        self,
+        hass: HomeAssistant,
+        session: aiohttp.ClientSession,
+        ip: str,
+        max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS,
+        max_scan_interval: int = DEFAULT_MAX_SCAN_INTERVAL,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
@@ -27,22 +157,508 @@ class OeloDataUpdateCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
             _LOGGER,
             name=f"Oelo Controller {ip}",
             update_interval=SCAN_INTERVAL,
+            # Only notify listeners when the zone state actually changed
+            always_update=False,
         )
         self.session = session
         self.ip = ip
+        self.dispatcher = OeloRequestDispatcher(self.name, max_concurrent_requests)
+
+        # Adaptive polling state
+        self.max_scan_interval = timedelta(seconds=max_scan_interval)
+        self._idle_scan_interval = SCAN_INTERVAL
+        self._fast_scan_until = 0.0
+        self._verification_pending = False
+
+        # Raw body of the last getController response, to skip decoding repeats
+        self._last_response_body: bytes | None = None
+        self.changed_polls = 0
+        self.unchanged_polls = 0
 
-    async def _async_update_data(self) -> list[dict[str, Any]]:
+        # Zone commands waiting to be coalesced, keyed by command
+        self._pending_commands: dict[
+            SetPatternCommand, list[tuple[frozenset[int], asyncio.Future[bool]]]
+        ] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+        # Last command each zone acknowledged, and the latest send per zone so
+        # a command superseded in the queue is not applied after a newer one
+        self.acked_commands: dict[int, SetPatternCommand] = {}
+        self._send_sequence = itertools.count()
+        self._latest_sends: dict[int, int] = {}
+        self.skipped_commands = 0
+
+        # Zone commands captured by the snapshot service, by snapshot id
+        self.snapshots: dict[str, dict[int, SetPatternCommand]] = {}
+
+        # Smoothed round-trip time of successful commands, in seconds
+        self.command_rtt: float | None = None
+        self.metrics = OeloMetrics()
+        self.breaker = OeloCircuitBreaker()
+
+        # Entity state writes skipped because nothing changed
+        self.suppressed_state_writes = 0
+
+    async def _async_update_data(self) -> dict[int, ZoneState]:
         """Fetch data from the Oelo controller."""
+        try:
+            data = await self.dispatcher.async_submit(
+                self._async_fetch_controller, priority=PRIORITY_POLL
+            )
+        except UpdateFailed:
+            # The verification poll is spent either way; let the next one run
+            self._verification_pending = False
+            if self.breaker.record_failure():
+                _LOGGER.warning("%s is unreachable; pausing commands", self.name)
+            if self.breaker.is_open:
+                # Probe on the breaker's backoff, never faster than polling was
+                self.update_interval = max(
+                    self.update_interval or self.breaker.probe_interval,
+                    self.breaker.probe_interval,
+                )
+            raise
+
+        if self.breaker.record_success():
+            _LOGGER.info("%s is reachable again", self.name)
+            if self.last_update_success:
+                # Opened by failed commands; a recovered poll is announced by
+                # the base class
+                self.async_update_listeners()
+
+        # After a command the cached data holds the expected state, so any
+        # difference means the command did not land as sent
+        self._verification_pending = False
+        if self.data is not None:
+            self._adapt_update_interval(changed=data != self.data)
+        return data
+
+    @property
+    def available(self) -> bool:
+        """Return True if the controller is reachable."""
+        return self.last_update_success and not self.breaker.is_open
+
+    async def async_request_refresh(self) -> None:
+        """Request a refresh unless a verification poll is already scheduled."""
+        if self._verification_pending:
+            return
+        await super().async_request_refresh()
+
+    def _adapt_update_interval(self, changed: bool) -> None:
+        """Pick the next polling interval from recent activity."""
+        now = self.hass.loop.time()
+        if changed:
+            self._fast_scan_until = now + FAST_SCAN_DURATION
+
+        if now < self._fast_scan_until:
+            self._idle_scan_interval = SCAN_INTERVAL
+            self.update_interval = FAST_SCAN_INTERVAL
+            return
+
+        if self.update_interval == self._idle_scan_interval:
+            # Nothing changed since the last idle poll; back off
+            self._idle_scan_interval = min(
+                self._idle_scan_interval * 2, self.max_scan_interval
+            )
+        self.update_interval = self._idle_scan_interval
+
+    @callback
+    def async_apply_command(
+        self, zones: Iterable[int], command: SetPatternCommand
+    ) -> None:
+        """Apply a confirmed command to the cached zone state.
+
+        Listeners are notified with the patched state and the next poll is
+        deferred to a single verification after COMMAND_SETTLE_DELAY.
+        """
+        data = dict(self.data or {})
+        for zone in zones:
+            self.acked_commands[zone] = command
+            if (current := data.get(zone)) is None:
+                continue
+            data[zone] = replace(
+                current,
+                pattern=command.pattern_type,
+                colors=command.colors,
+                speed=command.speed,
+                gap=command.gap,
+                direction=command.direction,
+            )
+
+        # The cached data no longer mirrors the last response body
+        self._last_response_body = None
+        self._verification_pending = True
+        self._idle_scan_interval = SCAN_INTERVAL
+        self.update_interval = COMMAND_SETTLE_DELAY
+        self.async_set_updated_data(data)
+
+    def is_command_applied(
+        self, zones: Iterable[int], command: SetPatternCommand
+    ) -> bool:
+        """Return True if every zone acknowledged the command and polling confirms it."""
+        if self._verification_pending or not self.available or not self.data:
+            return False
+        for zone in zones:
+            state = self.data.get(zone)
+            if (
+                state is None
+                or self.acked_commands.get(zone) != command
+                or not state.matches(command)
+            ):
+                return False
+        return True
+
+    async def _async_fetch_controller(self) -> dict[int, ZoneState]:
+        """Request the current zone state from the controller."""
         url = f"http://{self.ip}/getController"
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        # Probes of an unreachable controller give up sooner
+        timeout = PROBE_TIMEOUT if self.breaker.is_open else DEFAULT_TIMEOUT
         try:
-            async with asyncio.timeout(DEFAULT_TIMEOUT):
+            async with asyncio.timeout(timeout):
                 async with self.session.get(url) as response:
                     response.raise_for_status()
-                    data = await response.json(content_type=None)
-                    if not isinstance(data, list):
-                        raise UpdateFailed("Controller did not return a list")
-                    return data
+                    body = await response.read()
         except asyncio.TimeoutError as err:
+            self.metrics.poll_timeouts += 1
             raise UpdateFailed("Timeout communicating with Oelo controller") from err
         except aiohttp.ClientError as err:
-            raise UpdateFailed(f"Error communicating with Oelo controller: {err}") from err
\ No newline at end of file
+            self.metrics.poll_errors += 1
+            raise UpdateFailed(f"Error communicating with Oelo controller: {err}") from err
+        self.metrics.poll_rtt.add(loop.time() - start)
+
+        if body == self._last_response_body and self.data is not None:
+            # Returning the same object lets the base class skip listener dispatch
+            self.unchanged_polls += 1
+            return self.data
+
+        try:
+            data = json_loads(body)
+        except ValueError as err:
+            self.metrics.poll_errors += 1
+            raise UpdateFailed(f"Invalid response from Oelo controller: {err}") from err
+        if not isinstance(data, list):
+            self.metrics.poll_errors += 1
+            raise UpdateFailed("Controller did not return a list")
+
+        self._last_response_body = body
+        self.changed_polls += 1
+        return _parse_zones(data)
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending commands and stop the dispatcher."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        for waiters in self._pending_commands.values():
+            for _, future in waiters:
+                future.cancel()
+        self._pending_commands.clear()
+
+        await self.dispatcher.async_shutdown()
+        await super().async_shutdown()
+
+    @property
+    def debounce_interval(self) -> float:
+        """Return the debounce window sized from measured controller latency."""
+        if self.command_rtt is None:
+            return DEBOUNCE_INTERVAL
+        return max(
+            DEBOUNCE_MIN_INTERVAL,
+            min(self.command_rtt * DEBOUNCE_RTT_MULTIPLIER, DEBOUNCE_INTERVAL),
+        )
+
+    @property
+    def transition_frame_interval(self) -> float:
+        """Return the time between transition frames the controller can keep up with."""
+        if self.command_rtt is None:
+            return TRANSITION_MAX_FRAME_INTERVAL
+        return max(
+            TRANSITION_MIN_FRAME_INTERVAL,
+            min(self.command_rtt * TRANSITION_RTT_MULTIPLIER, TRANSITION_MAX_FRAME_INTERVAL),
+        )
+
+    def build_command_url(
+        self, zones: Iterable[int], command: SetPatternCommand
+    ) -> str:
+        """Build a setPattern URL for a command applied to the given zones."""
+        zone_list = sorted(set(zones))
+        zone_params = urllib.parse.urlencode(
+            {"num_zones": len(zone_list), "zones": ",".join(map(str, zone_list))}
+        )
+        return f"http://{self.ip}/setPattern?{command.to_query()}&{zone_params}"
+
+    async def async_send_command(
+        self,
+        zones: Iterable[int],
+        command: SetPatternCommand,
+        force: bool = False,
+    ) -> bool:
+        """Queue a command for the given zones and wait for the result.
+
+        Identical commands that arrive within
+        COMMAND_COALESCE_WINDOW are merged into a single multi-zone request.
+        Zones already confirmed to run the command are left out unless
+        ``force`` is set. Commands fail immediately while the circuit
+        breaker is open. Raises CommandSuperseded if a newer command for the
+        same zones replaced this one before it was sent.
+        """
+        if self.breaker.is_open:
+            self.metrics.rejected_commands += 1
+            return False
+
+        if not force:
+            zones = [zone for zone in zones if not self.is_command_applied((zone,), command)]
+            if not zones:
+                self.skipped_commands += 1
+                return True
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[bool] = loop.create_future()
+        self._pending_commands.setdefault(command, []).append((frozenset(zones), future))
+
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(
+                COMMAND_COALESCE_WINDOW, self._flush_pending_commands
+            )
+
+        return await future
+
+    @callback
+    def _flush_pending_commands(self) -> None:
+        """Hand the commands collected during the coalescing window to a send task."""
+        self._flush_handle = None
+        pending, self._pending_commands = self._pending_commands, {}
+        self.hass.async_create_background_task(
+            self._async_send_pending_commands(pending),
+            f"{self.name} setPattern",
+        )
+
+    async def _async_send_pending_commands(
+        self,
+        pending: dict[
+            SetPatternCommand, list[tuple[frozenset[int], asyncio.Future[bool]]]
+        ],
+    ) -> None:
+        """Dispatch one request per distinct command, covering all its zones."""
+        await asyncio.gather(
+            *(
+                self._async_send_coalesced(command, waiters)
+                for command, waiters in pending.items()
+            )
+        )
+
+    async def _async_send_coalesced(
+        self,
+        command: SetPatternCommand,
+        waiters: list[tuple[frozenset[int], asyncio.Future[bool]]],
+    ) -> None:
+        """Send a coalesced command and report the result to its callers."""
+        # Callers that were superseded while waiting no longer need their zones
+        waiters = [(zones, future) for zones, future in waiters if not future.done()]
+        if not waiters:
+            return
+
+        zones = frozenset().union(*(zones for zones, _ in waiters))
+        try:
+            success, _ = await self._async_dispatch(
+                PreparedCommand(zones, command, self.build_command_url(zones, command))
+            )
+        except CommandSuperseded:
+            for _, future in waiters:
+                if not future.done():
+                    future.set_exception(CommandSuperseded())
+            return
+        except asyncio.CancelledError:
+            for _, future in waiters:
+                future.cancel()
+            raise
+
+        for _, future in waiters:
+            if not future.done():
+                future.set_result(success)
+
+    @callback
+    def async_snapshot(self, zones: Iterable[int]) -> dict[int, SetPatternCommand]:
+        """Capture the commands the given zones are running."""
+        data = self.data or {}
+        return {
+            zone: command
+            for zone in zones
+            if (state := data.get(zone)) is not None
+            and (command := state.to_command()) is not None
+        }
+
+    async def async_restore(
+        self, snapshot: Mapping[int, SetPatternCommand], force: bool = False
+    ) -> tuple[bool, int]:
+        """Send captured zone commands with one request per distinct command.
+
+        Returns whether every request succeeded and how many were needed.
+        Zones taken over by a newer command count as not restored.
+        """
+        groups: dict[SetPatternCommand, list[int]] = {}
+        for zone, command in snapshot.items():
+            groups.setdefault(command, []).append(zone)
+
+        async def async_send(zones: list[int], command: SetPatternCommand) -> bool:
+            try:
+                return await self.async_send_command(zones, command, force)
+            except CommandSuperseded:
+                return False
+
+        results = await asyncio.gather(
+            *(async_send(zones, command) for command, zones in groups.items())
+        )
+        return all(results), len(groups)
+
+    async def async_prepare_command(
+        self,
+        zones: Iterable[int],
+        command: SetPatternCommand,
+    ) -> PreparedCommand | None:
+        """Get ready to send a command at a moment chosen by the caller.
+
+        A poll opens a keep-alive connection for the send. Every zone is
+        included, even one already running the command, since the point of
+        a timed send is to restart the pattern in step. Returns None if the
+        controller is unreachable.
+        """
+        if self.breaker.is_open:
+            self.metrics.rejected_commands += 1
+            return None
+
+        await self.async_refresh()
+        if not self.available:
+            return None
+
+        zone_set = frozenset(zones)
+        return PreparedCommand(zone_set, command, self.build_command_url(zone_set, command))
+
+    async def async_send_prepared(
+        self, prepared: PreparedCommand
+    ) -> tuple[bool, float | None]:
+        """Send a prepared command right away, bypassing the coalescing window.
+
+        Returns the result and the loop time at which the request started,
+        or None if nothing was sent. A send replaced by a newer command
+        counts as failed.
+        """
+        if not prepared.zones:
+            self.skipped_commands += 1
+            return True, None
+        try:
+            return await self._async_dispatch(prepared)
+        except CommandSuperseded:
+            return False, None
+
+    async def _async_dispatch(
+        self, prepared: PreparedCommand
+    ) -> tuple[bool, float | None]:
+        """Send a command through the dispatcher and apply it once confirmed."""
+        zones, command, url = prepared
+        sequence = next(self._send_sequence)
+        for zone in zones:
+            self._latest_sends[zone] = sequence
+
+        loop = asyncio.get_running_loop()
+        started: float | None = None
+
+        async def async_request() -> bool:
+            nonlocal started
+            started = loop.time()
+            return await self._async_send_request(url)
+
+        try:
+            success = await self.dispatcher.async_submit(
+                async_request, priority=PRIORITY_COMMAND, zones=zones
+            )
+        except asyncio.CancelledError:
+            # Only a waiter cancelled by the dispatcher shutting down is a
+            # failed send; cancelling the caller itself must propagate
+            if (task := asyncio.current_task()) is not None and task.cancelling():
+                raise
+            success = False
+
+        if success:
+            # Zones taken over by a newer command keep that command's state
+            if current := [z for z in zones if self._latest_sends.get(z) == sequence]:
+                self.async_apply_command(current, command)
+        else:
+            for zone in zones:
+                self.acked_commands.pop(zone, None)
+        return success, started
+
+    async def _async_send_request(self, url: str) -> bool:
+        """Send a single command request to the controller."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        try:
+            async with asyncio.timeout(DEFAULT_TIMEOUT):
+                async with self.session.get(url) as response:
+                    response.raise_for_status()
+        except asyncio.TimeoutError:
+            self.metrics.command_timeouts += 1
+            _LOGGER.warning("Timeout sending command to Oelo controller")
+        except aiohttp.ClientError as err:
+            self.metrics.command_errors += 1
+            _LOGGER.warning("Error sending command to Oelo controller: %s", err)
+        except Exception as err:  # noqa: BLE001
+            self.metrics.command_errors += 1
+            _LOGGER.exception("Unexpected error sending command: %s", err)
+        else:
+            self._record_command_rtt(loop.time() - start)
+            if self.breaker.record_success():
+                self.async_update_listeners()
+            return True
+
+        if self.breaker.record_failure():
+            _LOGGER.warning("%s is unreachable; pausing commands", self.name)
+            # Probe on the breaker's schedule, starting with a poll now, and
+            # mark all zones unavailable at once
+            self.update_interval = self.breaker.probe_interval
+            self.hass.async_create_background_task(
+                self.async_request_refresh(), f"{self.name} probe"
+            )
+            self.async_update_listeners()
+        return False
+
+    def _record_command_rtt(self, rtt: float) -> None:
+        """Fold a command round-trip time into the moving average."""
+        self.metrics.command_rtt.add(rtt)
+        if self.command_rtt is None:
+            self.command_rtt = rtt
+        else:
+            self.command_rtt += RTT_SMOOTHING * (rtt - self.command_rtt)
+
+
+def _parse_zones(data: list[Any]) -> dict[int, ZoneState]:
+    """Parse the zone entries of a getController response, indexed by zone number."""
+    return {
+        item["num"]: ZoneState.from_dict(item)
+        for item in data
+        if isinstance(item, dict) and isinstance(item.get("num"), int)
+    }
+
+
+def _parse_colors(value: Any) -> tuple[RGBColor, ...]:
+    """Parse a flat color list or comma-separated color string into RGB tuples."""
+    if isinstance(value, str):
+        value = value.split(",")
+    if not isinstance(value, (list, tuple)):
+        return ()
+    try:
+        values = [max(0, min(int(v), 255)) for v in value]
+    except (ValueError, TypeError):
+        return ()
+    return tuple(
+        (values[i], values[i + 1], values[i + 2]) for i in range(0, len(values) - 2, 3)
+    )
+
+
+def _parse_int(value: Any) -> int | None:
+    """Parse an optional integer field."""
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
@@ -0,0 +1,42 @@
+"""Diagnostics support for Oelo Lights integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_IP_ADDRESS
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import OeloDataUpdateCoordinator
+
+TO_REDACT = {CONF_IP_ADDRESS, "title", "unique_id"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: OeloDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "circuit_open": coordinator.breaker.is_open,
+            "consecutive_failures": coordinator.breaker.failures,
+            "update_interval": str(coordinator.update_interval),
+            "command_rtt": coordinator.command_rtt,
+            "debounce_interval": coordinator.debounce_interval,
+            "queue_depth": coordinator.dispatcher.queue_depth,
+            "suppressed_state_writes": coordinator.suppressed_state_writes,
+            "skipped_commands": coordinator.skipped_commands,
+            "changed_polls": coordinator.changed_polls,
+            "unchanged_polls": coordinator.unchanged_polls,
+        },
+        "metrics": coordinator.metrics.as_dict(),
+        "zones": {
+            num: dict(zone.raw) for num, zone in (coordinator.data or {}).items()
+        },
+    }
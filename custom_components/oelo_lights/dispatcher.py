@@ -0,0 +1,148 @@
+"""Per-controller request dispatcher for Oelo Lights integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+import heapq
+import itertools
+import logging
+from typing import Any, TypeVar
+
+from .const import MAX_CONCURRENT_REQUESTS
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# Lower values are dispatched first
+PRIORITY_COMMAND = 0
+PRIORITY_POLL = 10
+
+
+class CommandSuperseded(Exception):
+    """Raised to callers of a queued command replaced before it was sent."""
+
+
+@dataclass(slots=True)
+class _QueuedRequest:
+    """A request waiting for a free dispatcher slot."""
+
+    request: Callable[[], Awaitable[Any]]
+    zones: frozenset[int] | None
+    waiters: list[asyncio.Future[Any]] = field(default_factory=list)
+    superseded: bool = False
+
+
+class OeloRequestDispatcher:
+    """Serialize requests to a single controller with priority ordering.
+
+    At most ``max_concurrent`` requests are in flight at once. Queued commands
+    are dispatched before polls, and a queued command is superseded by a newer
+    command covering the same zones; it is never sent and its callers get
+    CommandSuperseded. Concurrent poll requests share a single fetch.
+    """
+
+    def __init__(self, name: str, max_concurrent: int = MAX_CONCURRENT_REQUESTS) -> None:
+        """Initialize the dispatcher."""
+        self._name = name
+        self._max_concurrent = max(1, max_concurrent)
+        self._queue: list[tuple[int, int, _QueuedRequest]] = []
+        self._sequence = itertools.count()
+        self._workers: set[asyncio.Task[None]] = set()
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of requests waiting to be dispatched."""
+        return sum(1 for _, _, queued in self._queue if not queued.superseded)
+
+    async def async_submit(
+        self,
+        request: Callable[[], Awaitable[_T]],
+        *,
+        priority: int,
+        zones: frozenset[int] | None = None,
+    ) -> _T:
+        """Queue a request and wait for its result.
+
+        Commands pass the zones they target; requests without zones are
+        treated as polls.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[_T] = loop.create_future()
+
+        for queued_priority, _, queued in self._queue:
+            if queued.superseded or queued_priority != priority:
+                continue
+            if zones is None and queued.zones is None:
+                # An identical poll is already waiting; share its result
+                queued.waiters.append(future)
+                return await future
+
+        queued = _QueuedRequest(request, zones, [future])
+        if zones:
+            for _, _, older in self._queue:
+                if older.superseded or not older.zones or not older.zones <= zones:
+                    continue
+                older.superseded = True
+                for waiter in older.waiters:
+                    if not waiter.done():
+                        waiter.set_exception(CommandSuperseded())
+
+        heapq.heappush(self._queue, (priority, next(self._sequence), queued))
+        self._start_workers(loop)
+        return await future
+
+    def _start_workers(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start drain tasks until the concurrency limit is reached."""
+        while len(self._workers) < self._max_concurrent and len(self._workers) < len(
+            self._queue
+        ):
+            self._workers.add(
+                loop.create_task(self._async_drain(), name=f"{self._name} dispatcher")
+            )
+
+    async def _async_drain(self) -> None:
+        """Dispatch queued requests one at a time until the queue is empty."""
+        try:
+            await self._async_drain_queue()
+        finally:
+            # Deregister synchronously so a request queued right after the
+            # last one completes always finds room for a new worker
+            self._workers.discard(asyncio.current_task())  # type: ignore[arg-type]
+
+    async def _async_drain_queue(self) -> None:
+        """Dispatch queued requests until the queue is empty."""
+        while self._queue:
+            _, _, queued = heapq.heappop(self._queue)
+            waiters = [waiter for waiter in queued.waiters if not waiter.done()]
+            if queued.superseded or not waiters:
+                continue
+
+            try:
+                result = await queued.request()
+            except asyncio.CancelledError:
+                for waiter in waiters:
+                    waiter.cancel()
+                raise
+            except Exception as err:  # noqa: BLE001
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_exception(err)
+            else:
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_result(result)
+
+    async def async_shutdown(self) -> None:
+        """Cancel queued and in-flight requests."""
+        for _, _, queued in self._queue:
+            for waiter in queued.waiters:
+                waiter.cancel()
+        self._queue.clear()
+
+        workers = list(self._workers)
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        _LOGGER.debug("%s dispatcher stopped", self._name)
@@ -2,47 +2,45 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Sequence
+from functools import partial
 import logging
-import urllib.parse
 from typing import Any
 
-import aiohttp
-import voluptuous as vol
-
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
     ATTR_EFFECT,
     ATTR_RGB_COLOR,
+    ATTR_TRANSITION,
     ColorMode,
     LightEntity,
     LightEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_IP_ADDRESS, STATE_ON
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers import aiohttp_client, config_validation as cv, entity_platform
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.const import STATE_ON
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
-from homeassistant.helpers.storage import Store
 
+from .colors import RGBColor
 from .const import (
-    DEBOUNCE_INTERVAL,
     DEFAULT_BRIGHTNESS,
     DEFAULT_COLOR,
-    DEFAULT_TIMEOUT,
     DOMAIN,
-    MAX_COLORS,
     MODE_CUSTOM,
     MODE_PRESET,
     NUM_ZONES,
     PATTERN_TYPE_CUSTOM,
     PATTERN_TYPE_OFF,
-    STORAGE_KEY_BASE,
-    STORAGE_VERSION,
 )
-from .coordinator import OeloDataUpdateCoordinator
-from .patterns import get_preset, get_preset_names
+from .coordinator import OeloDataUpdateCoordinator, ZoneState, controller_device_info
+from .dispatcher import CommandSuperseded
+from .patterns import find_preset_name, get_preset_command, get_preset_names
+from .protocol import SetPatternCommand
+from .services import CONTROL_LIGHTS_FIELDS, SERVICE_CONTROL_LIGHTS
+from .storage import OeloEntityStore
+from .transition import async_run_transition
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -56,39 +54,30 @@ async def async_setup_entry(
     # Retrieve coordinator from hass.data (created and validated in __init__.py)
     coordinator: OeloDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
 
-    # Set up storage for entity data
-    storage_key = f"{STORAGE_KEY_BASE}_{entry.entry_id}"
-    store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, storage_key)
-    stored_data = await store.async_load() or {}
-
-    # Store store and stored_entity_data in hass.data
+    # Set up storage for entity data; pending writes are flushed on unload
+    store = OeloEntityStore(hass, entry.entry_id)
+    stored_data = await store.async_load()
     hass.data[DOMAIN][entry.entry_id]["store"] = store
-    hass.data[DOMAIN][entry.entry_id]["stored_entity_data"] = stored_data
 
     entities = [
         OeloLight(
             coordinator=coordinator,
             zone=zone,
             entry=entry,
-            restored_last_command=stored_data.get(f"zone_{zone}_last_command"),
+            restored_last_command=_command_from_stored(
+                stored_data.get(f"zone_{zone}_last_command")
+            ),
         )
         for zone in range(1, NUM_ZONES + 1)
     ]
-    async_add_entities(entities, update_before_add=True)
+    # The coordinator already holds fresh data from its first refresh
+    async_add_entities(entities)
 
     # Register the control service
     platform = entity_platform.async_get_current_platform()
     platform.async_register_entity_service(
-        "control_lights",
-        {
-            vol.Required("mode"): vol.In([MODE_PRESET, MODE_CUSTOM]),
-            vol.Optional("target_zones"): cv.ensure_list,
-            vol.Optional("preset_name"): cv.string,
-            vol.Optional("custom_pattern_type", default=PATTERN_TYPE_CUSTOM): cv.string,
-            vol.Optional("colors"): vol.All(cv.ensure_list, vol.Length(max=MAX_COLORS)),
-            vol.Optional("speed", default=1): vol.All(vol.Coerce(int), vol.Range(min=0, max=20)),
-            vol.Optional("gap", default=0): vol.All(vol.Coerce(int), vol.Range(min=0, max=20)),
-        },
+        SERVICE_CONTROL_LIGHTS,
+        CONTROL_LIGHTS_FIELDS,
         "async_control_oelo_lights",
     )
 
@@ -100,14 +89,14 @@ class OeloLight(LightEntity, RestoreEntity):
     _attr_should_poll = False
     _attr_supported_color_modes = {ColorMode.RGB}
     _attr_color_mode = ColorMode.RGB
-    _attr_supported_features = LightEntityFeature.EFFECT
+    _attr_supported_features = LightEntityFeature.EFFECT | LightEntityFeature.TRANSITION
 
     def __init__(
         self,
         coordinator: OeloDataUpdateCoordinator,
         zone: int,
         entry: ConfigEntry,
-        restored_last_command: str | None = None,
+        restored_last_command: SetPatternCommand | None = None,
     ) -> None:
         """Initialize an Oelo Light entity."""
         self.coordinator = coordinator
@@ -117,29 +106,29 @@ class OeloLight(LightEntity, RestoreEntity):
         self._brightness: int = DEFAULT_BRIGHTNESS
         self._rgb_color: tuple[int, int, int] = DEFAULT_COLOR
         self._intended_effect: str | None = None
-        self._last_successful_command: str | None = restored_last_command
+        self._last_command: SetPatternCommand | None = restored_last_command
+        self._zone_state: ZoneState | None = None
+        # Pattern and colors this entity last sent, to tell them apart from app changes
+        self._sent_pattern: tuple[str, tuple[RGBColor, ...]] | None = None
 
         # Debouncing state
-        self._pending_command_url: str | None = None
+        self._pending_command: SetPatternCommand | None = None
+        self._pending_command_zones: list[int] | None = None
+        self._pending_command_force = False
         self._pending_command_future: asyncio.Future[bool] | None = None
         self._debounce_task: asyncio.Task[None] | None = None
+        self._debounce_quiet_at: float = 0.0
+        self._transition_task: asyncio.Task[bool] | None = None
+
+        # Last state written to the state machine, used to skip no-op writes
+        self._last_written_state: tuple[Any, ...] | None = None
 
         # Entity attributes
         self._attr_unique_id = f"{entry.entry_id}_zone_{zone}"
+        self._attr_device_info = controller_device_info(entry, coordinator.ip)
         self._attr_name = f"Zone {zone}"
         self._attr_available = True
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info for this entity."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=self._entry.title,
-            manufacturer="Oelo",
-            model="Light Controller",
-            configuration_url=f"http://{self.coordinator.ip}/",
-        )
-
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
@@ -168,14 +157,28 @@ class OeloLight(LightEntity, RestoreEntity):
         return self._intended_effect
 
     @property
-    def effect_list(self) -> list[str] | None:
+    def effect_list(self) -> Sequence[str] | None:
         """Return the list of available effects."""
         return get_preset_names() if self.available else None
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the pattern settings the controller reports for this zone."""
+        if not self.available or self._zone_state is None:
+            return None
+        return {
+            "pattern": self._zone_state.pattern,
+            "speed": self._zone_state.speed,
+            "gap": self._zone_state.gap,
+            "direction": self._zone_state.direction,
+        }
+
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
         await super().async_added_to_hass()
-        self.coordinator.async_add_listener(self._handle_coordinator_update)
+        self.async_on_remove(
+            self.coordinator.async_add_listener(self._handle_coordinator_update)
+        )
 
         last_state = await self.async_get_last_state()
         if last_state:
@@ -189,31 +192,54 @@ class OeloLight(LightEntity, RestoreEntity):
             else:
                 self._rgb_color = DEFAULT_COLOR
 
+        # Listeners only hear about changes, so pick up the data the
+        # coordinator already holds from its first refresh
+        self._handle_coordinator_update()
+
     async def async_will_remove_from_hass(self) -> None:
         """Run when entity is being removed."""
         if self._debounce_task:
             self._debounce_task.cancel()
+        if self._pending_command_future:
+            self._pending_command_future.cancel()
+        if self._transition_task:
+            self._transition_task.cancel()
 
     async def async_update(self) -> None:
-        """Request a coordinator refresh."""
+        """Request a coordinator refresh unless a command is still settling."""
         await self.coordinator.async_request_refresh()
 
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state to the state machine and remember what was written."""
+        self._last_written_state = self._state_snapshot()
+        super().async_write_ha_state()
+
+    def _state_snapshot(self) -> tuple[Any, ...]:
+        """Return the values that determine the entity's written state."""
+        return (
+            self._attr_available,
+            self._state,
+            self._intended_effect,
+            self._rgb_color,
+            self._brightness,
+            self.extra_state_attributes,
+        )
+
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if not self.coordinator.last_update_success:
-            if self._attr_available:
-                self._attr_available = False
-                self.async_write_ha_state()
+        if not self.coordinator.available:
+            self._attr_available = False
+            self._async_write_state_if_changed()
             return
 
-        zone_data = self._get_zone_data()
-        if not zone_data:
+        zone_state = self._get_zone_data()
+        if not zone_state:
             self._attr_available = False
-            self.async_write_ha_state()
+            self._async_write_state_if_changed()
             return
 
-        current_pattern = zone_data.get("pattern")
-        is_on = current_pattern != PATTERN_TYPE_OFF
+        is_on = zone_state.pattern != PATTERN_TYPE_OFF
         state_changed = self._state != is_on
 
         if not self._attr_available:
@@ -224,68 +250,107 @@ class OeloLight(LightEntity, RestoreEntity):
             if not is_on:
                 self._intended_effect = None
 
+        previous = self._zone_state
+        polled_pattern = (zone_state.pattern, zone_state.colors)
+        if (
+            is_on
+            and zone_state.colors
+            and previous is not None
+            and polled_pattern != (previous.pattern, previous.colors)
+            and polled_pattern != self._sent_pattern
+        ):
+            # The zone was changed outside Home Assistant, e.g. from the Oelo app
+            self._rgb_color = zone_state.colors[0]
+            self._intended_effect = find_preset_name(zone_state.pattern, zone_state.colors)
+            self._sent_pattern = polled_pattern  # type: ignore[assignment]
+            # Dimming should re-render the app's pattern, not the last one sent from here
+            self._last_command = zone_state.to_command()
+            self._save_last_command()
+
+        self._zone_state = zone_state
+        self._async_write_state_if_changed()
+
+    def _async_write_state_if_changed(self) -> None:
+        """Write state only if it differs from what was last written."""
+        if self._state_snapshot() == self._last_written_state:
+            self.coordinator.suppressed_state_writes += 1
+            return
         self.async_write_ha_state()
 
-    def _get_zone_data(self) -> dict[str, Any] | None:
+    def _get_zone_data(self) -> ZoneState | None:
         """Get data for this zone from coordinator."""
         data = self.coordinator.data
         if not data:
             return None
-
-        for item in data:
-            if isinstance(item, dict) and item.get("num") == self._zone:
-                return item
-        return None
+        return data.get(self._zone)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the light on."""
-        url_to_send: str | None = None
+        command_to_set: SetPatternCommand | None = None
         effect_to_set: str | None = self._intended_effect
         rgb_to_set: tuple[int, int, int] = self._rgb_color
         brightness_to_set = kwargs.get(ATTR_BRIGHTNESS, self._brightness) or DEFAULT_BRIGHTNESS
         brightness_to_set = max(0, min(brightness_to_set, 255))
-        brightness_factor = brightness_to_set / 255.0
 
         if ATTR_RGB_COLOR in kwargs:
             rgb_to_set = tuple(kwargs[ATTR_RGB_COLOR])  # type: ignore[assignment]
             effect_to_set = None
-            url_to_send = self._build_color_url(rgb_to_set, brightness_factor)
+            command_to_set = SetPatternCommand.from_input(
+                PATTERN_TYPE_CUSTOM, [rgb_to_set]
+            )
 
         elif ATTR_EFFECT in kwargs:
             selected_effect = kwargs[ATTR_EFFECT]
-            preset = get_preset(selected_effect)
-            if preset:
+            command_to_set = get_preset_command(selected_effect)
+            if command_to_set:
                 effect_to_set = selected_effect
-                url_to_send = self._build_preset_url(preset, brightness_factor)
 
-        elif not self._state:
-            # Turning on without specific params
-            if self._last_successful_command:
-                url_to_send = self._adjust_colors_in_url(
-                    self._last_successful_command, brightness_factor
-                )
+        elif not self._state or ATTR_BRIGHTNESS in kwargs:
+            # Turning on or dimming re-renders the last command, or the current
+            # color when there is none, at the new brightness
+            if self._last_command:
+                command_to_set = self._last_command
             else:
-                rgb_to_set = DEFAULT_COLOR
-                url_to_send = self._build_color_url(rgb_to_set, brightness_factor)
-
-        if url_to_send:
-            success = await self._buffered_send_request(url_to_send)
+                command_to_set = SetPatternCommand(PATTERN_TYPE_CUSTOM, (rgb_to_set,))
+
+        if command_to_set:
+            target = command_to_set.scaled(brightness_to_set)
+            try:
+                if transition := kwargs.get(ATTR_TRANSITION):
+                    success = await self._async_send_transition(target, transition)
+                else:
+                    success = await self._buffered_send_request(target)
+            except CommandSuperseded:
+                # A newer command took over the zone and reports its own outcome
+                return
             if success:
                 self._state = True
                 self._brightness = brightness_to_set
                 self._rgb_color = rgb_to_set
                 self._intended_effect = effect_to_set
-                self._last_successful_command = url_to_send
+                self._last_command = command_to_set
+                self._save_last_command()
                 self.async_write_ha_state()
             else:
                 _LOGGER.warning("Failed to send command to Oelo controller")
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the light off."""
-        url_params = self._build_base_params(PATTERN_TYPE_OFF, [(0, 0, 0)])
-        url = f"http://{self.coordinator.ip}/setPattern?{urllib.parse.urlencode(url_params)}"
-
-        success = await self._buffered_send_request(url)
+        try:
+            if (
+                (transition := kwargs.get(ATTR_TRANSITION))
+                and self._state
+                and self._last_command
+            ):
+                # Fade the running pattern to black before switching the zone off
+                target = self._last_command.scaled(0)
+                success = await self._async_send_transition(
+                    target, transition, final=SetPatternCommand.off()
+                )
+            else:
+                success = await self._buffered_send_request(SetPatternCommand.off())
+        except CommandSuperseded:
+            return
         if success:
             self._state = False
             self.async_write_ha_state()
@@ -301,13 +366,12 @@ class OeloLight(LightEntity, RestoreEntity):
         colors: list[list[int]] | None = None,
         speed: int = 1,
         gap: int = 0,
+        force: bool = False,
     ) -> None:
         """Handle the control_lights service call."""
-        zone_list = [str(z) for z in target_zones] if target_zones else [str(self._zone)]
-        zones_str = ",".join(zone_list)
-        num_zones = len(zone_list)
+        zone_list = [int(z) for z in target_zones] if target_zones else [self._zone]
 
-        url_to_send: str | None = None
+        command_to_set: SetPatternCommand | None = None
         effect_name: str | None = None
 
         if mode == MODE_PRESET:
@@ -315,51 +379,46 @@ class OeloLight(LightEntity, RestoreEntity):
                 _LOGGER.error("Preset name required for Preset mode")
                 return
 
-            preset = get_preset(preset_name)
-            if not preset:
+            command_to_set = get_preset_command(
+                preset_name,
+                speed=speed if speed != 1 else None,
+                gap=gap if gap != 0 else None,
+            )
+            if not command_to_set:
                 _LOGGER.error("Preset '%s' not found", preset_name)
                 return
 
-            url_to_send = self._build_preset_url(
-                preset,
-                brightness_factor=1.0,
-                zones_str=zones_str,
-                num_zones=num_zones,
-                speed_override=speed if speed != 1 else None,
-                gap_override=gap if gap != 0 else None,
-            )
             effect_name = preset_name
-            if preset.colors:
-                self._rgb_color = preset.colors[0]
+            self._rgb_color = command_to_set.colors[0]
 
         elif mode == MODE_CUSTOM:
             if not colors:
                 _LOGGER.error("Colors required for Custom mode")
                 return
 
-            validated_colors = self._validate_colors(colors)
-            if not validated_colors:
-                _LOGGER.error("Invalid colors provided")
+            try:
+                command_to_set = SetPatternCommand.from_input(
+                    custom_pattern_type, colors, speed, gap
+                )
+            except ValueError as err:
+                _LOGGER.error("Invalid colors provided: %s", err)
                 return
 
-            url_to_send = self._build_custom_url(
-                pattern_type=custom_pattern_type,
-                colors=validated_colors,
-                zones_str=zones_str,
-                num_zones=num_zones,
-                speed=speed,
-                gap=gap,
-            )
             effect_name = custom_pattern_type
-            self._rgb_color = validated_colors[0]
+            self._rgb_color = command_to_set.colors[0]
 
-        if url_to_send:
-            success = await self._buffered_send_request(url_to_send)
+        if command_to_set:
+            try:
+                success = await self._buffered_send_request(
+                    command_to_set, zone_list, force=force
+                )
+            except CommandSuperseded:
+                return
             if success:
                 self._state = True
                 self._intended_effect = effect_name
-                self._last_successful_command = url_to_send
-                await self._save_last_command()
+                self._last_command = command_to_set
+                self._save_last_command()
                 self.async_write_ha_state()
             else:
                 _LOGGER.error("Failed to execute control_lights command")
@@ -378,127 +437,9 @@ class OeloLight(LightEntity, RestoreEntity):
         except (ValueError, TypeError):
             return False
 
-    def _validate_colors(
-        self, colors: list[list[int]]
-    ) -> list[tuple[int, int, int]] | None:
-        """Validate and convert a list of colors."""
-        validated: list[tuple[int, int, int]] = []
-        for color in colors[:MAX_COLORS]:
-            if isinstance(color, (list, tuple)) and len(color) >= 3:
-                try:
-                    validated.append((int(color[0]), int(color[1]), int(color[2])))
-                except (ValueError, TypeError):
-                    return None
-            else:
-                return None
-        return validated if validated else None
-
-    def _build_base_params(
-        self,
-        pattern_type: str,
-        colors: list[tuple[int, int, int]],
-        zones_str: str | None = None,
-        num_zones: int = 1,
-        speed: int = 0,
-        gap: int = 0,
-    ) -> dict[str, Any]:
-        """Build base URL parameters for setPattern endpoint."""
-        color_values = []
-        for rgb in colors:
-            color_values.extend(rgb)
-
-        return {
-            "patternType": pattern_type,
-            "num_zones": num_zones,
-            "zones": zones_str or str(self._zone),
-            "num_colors": len(colors),
-            "colors": ",".join(map(str, color_values)),
-            "direction": "F",
-            "speed": speed,
-            "gap": gap,
-            "other": 0,
-            "pause": 0,
-        }
-
-    def _build_color_url(
-        self,
-        rgb: tuple[int, int, int],
-        brightness_factor: float,
-    ) -> str:
-        """Build URL for a single color command."""
-        scaled = self._scale_color(rgb, brightness_factor)
-        params = self._build_base_params(PATTERN_TYPE_CUSTOM, [scaled])
-        return f"http://{self.coordinator.ip}/setPattern?{urllib.parse.urlencode(params)}"
-
-    def _build_preset_url(
-        self,
-        preset: Any,  # PatternConfig
-        brightness_factor: float,
-        zones_str: str | None = None,
-        num_zones: int = 1,
-        speed_override: int | None = None,
-        gap_override: int | None = None,
-    ) -> str:
-        """Build URL for a preset pattern command."""
-        scaled_colors = [self._scale_color(c, brightness_factor) for c in preset.colors]
-        params = self._build_base_params(
-            pattern_type=preset.pattern_type,
-            colors=scaled_colors,
-            zones_str=zones_str,
-            num_zones=num_zones,
-            speed=speed_override if speed_override is not None else preset.speed,
-            gap=gap_override if gap_override is not None else preset.gap,
-        )
-        return f"http://{self.coordinator.ip}/setPattern?{urllib.parse.urlencode(params)}"
-
-    def _build_custom_url(
-        self,
-        pattern_type: str,
-        colors: list[tuple[int, int, int]],
-        zones_str: str,
-        num_zones: int,
-        speed: int,
-        gap: int,
-    ) -> str:
-        """Build URL for a custom pattern command."""
-        params = self._build_base_params(
-            pattern_type=pattern_type,
-            colors=colors,
-            zones_str=zones_str,
-            num_zones=num_zones,
-            speed=speed,
-            gap=gap,
-        )
-        return f"http://{self.coordinator.ip}/setPattern?{urllib.parse.urlencode(params)}"
-
-    @staticmethod
-    def _scale_color(
-        rgb: tuple[int, int, int], factor: float
-    ) -> tuple[int, int, int]:
-        """Scale RGB color by brightness factor."""
-        return tuple(  # type: ignore[return-value]
-            max(0, min(int(round(c * factor)), 255)) for c in rgb
-        )
-
-    def _adjust_colors_in_url(self, url: str, brightness_factor: float) -> str:
-        """Adjust color values in an existing URL by brightness factor."""
-        try:
-            parsed = urllib.parse.urlparse(url)
-            query = urllib.parse.parse_qs(parsed.query)
-
-            if "colors" in query:
-                color_values = [int(c) for c in query["colors"][0].split(",")]
-                scaled = [max(0, min(int(round(v * brightness_factor)), 255)) for v in color_values]
-                query["colors"] = [",".join(map(str, scaled))]
-                new_query = urllib.parse.urlencode(query, doseq=True)
-                return urllib.parse.urlunparse(parsed._replace(query=new_query))
-        except (ValueError, KeyError, IndexError) as err:
-            _LOGGER.debug("Failed to adjust colors in URL: %s", err)
-
-        return url
-
-    async def _save_last_command(self) -> None:
-        """Save the last successful command to persistent storage."""
+    @callback
+    def _save_last_command(self) -> None:
+        """Queue the last successful command for persistent storage."""
         if not self.hass:
             return
 
@@ -506,71 +447,156 @@ class OeloLight(LightEntity, RestoreEntity):
         if not entry_data:
             return
 
-        store: Store[dict[str, Any]] | None = entry_data.get("store")
-        stored_data: dict[str, Any] | None = entry_data.get("stored_entity_data")
-
-        if not store or stored_data is None:
+        store: OeloEntityStore | None = entry_data.get("store")
+        if not store:
             return
 
-        entity_key = f"zone_{self._zone}_last_command"
-
-        if self._last_successful_command is None:
-            stored_data.pop(entity_key, None)
-        else:
-            stored_data[entity_key] = self._last_successful_command
+        store.async_set(
+            f"zone_{self._zone}_last_command",
+            self._last_command.as_dict() if self._last_command else None,
+        )
 
-        try:
-            await store.async_save(stored_data)
-        except Exception as err:  # noqa: BLE001
-            _LOGGER.warning("Failed to save last command to storage: %s", err)
+    async def _buffered_send_request(
+        self,
+        command: SetPatternCommand,
+        zones: list[int] | None = None,
+        force: bool = False,
+        immediate: bool = False,
+    ) -> bool:
+        """Send a request with debouncing to avoid overwhelming the controller.
+
+        The first command after a quiet period is sent right away (leading
+        edge); commands arriving within the debounce window collapse into a
+        single trailing send once the burst settles. A command the zones are
+        already confirmed to run is skipped unless ``force`` is set. Raises
+        CommandSuperseded if a newer command replaced it, either during the
+        debounce delay or in the controller's queue.
+
+        Transition frames pass ``immediate`` to bypass the debounce delay;
+        any other command cancels a running transition.
+        """
+        if not immediate and self._transition_task and not self._transition_task.done():
+            self._transition_task.cancel()
+
+        zones = zones or [self._zone]
+        debounce_pending = self._debounce_task is not None and not self._debounce_task.done()
+        if (
+            not force
+            and not debounce_pending
+            and self.coordinator.is_command_applied(zones, command)
+        ):
+            self.coordinator.skipped_commands += 1
+            return True
 
-    async def _buffered_send_request(self, url: str) -> bool:
-        """Send a request with debouncing to avoid overwhelming the controller."""
         loop = asyncio.get_running_loop()
+        now = loop.time()
+        window = self.coordinator.debounce_interval
+        delay = window if now < self._debounce_quiet_at and not immediate else 0.0
+        self._debounce_quiet_at = now + window
 
         # Cancel any pending request
         if self._debounce_task and not self._debounce_task.done():
             self._debounce_task.cancel()
         if self._pending_command_future and not self._pending_command_future.done():
-            self._pending_command_future.cancel()
+            # Counted in the metrics rather than reported as a failed send
+            self._pending_command_future.set_exception(CommandSuperseded())
+            self.coordinator.metrics.debounce_cancels += 1
 
-        self._pending_command_url = url
+        self._pending_command = command
+        self._pending_command_zones = zones
+        self._pending_command_force = force
         self._pending_command_future = loop.create_future()
-        self._debounce_task = loop.create_task(self._debounce_and_send())
+        self._debounce_task = loop.create_task(self._debounce_and_send(delay))
 
         try:
             return await self._pending_command_future
         except asyncio.CancelledError:
+            if (task := asyncio.current_task()) is not None and task.cancelling():
+                raise
             return False
 
-    async def _debounce_and_send(self) -> None:
-        """Wait for debounce interval then send the pending command."""
+    async def _async_send_transition(
+        self,
+        target: SetPatternCommand,
+        duration: float,
+        final: SetPatternCommand | None = None,
+    ) -> bool:
+        """Fade from the zone's current colors to a command.
+
+        Returns False if the transition failed. Raises CommandSuperseded if a
+        newer command cancelled it.
+        """
+        if self._transition_task and not self._transition_task.done():
+            self._transition_task.cancel()
+
+        zone_state = self._zone_state
+        if self._state and zone_state is not None and zone_state.colors:
+            start_colors = zone_state.colors
+        else:
+            start_colors = ((0, 0, 0),)
+
+        task = self._transition_task = asyncio.get_running_loop().create_task(
+            async_run_transition(
+                start_colors,
+                target,
+                duration,
+                partial(self._buffered_send_request, immediate=True),
+                lambda: self.coordinator.transition_frame_interval,
+                final,
+            )
+        )
         try:
-            await asyncio.sleep(DEBOUNCE_INTERVAL)
+            await asyncio.wait((task,))
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        if task.cancelled():
+            raise CommandSuperseded
+        return task.result()
+
+    async def _debounce_and_send(self, delay: float) -> None:
+        """Wait out the debounce delay then hand the pending command to the coordinator."""
+        try:
+            if delay:
+                await asyncio.sleep(delay)
 
-            url = self._pending_command_url
+            command = self._pending_command
+            zones = self._pending_command_zones
             future = self._pending_command_future
 
-            if not url or not future or future.cancelled():
+            if not command or not zones or not future or future.cancelled():
                 return
 
-            async with asyncio.timeout(DEFAULT_TIMEOUT):
-                async with self.coordinator.session.get(url) as response:
-                    response.raise_for_status()
-                    if not future.done():
-                        future.set_result(True)
+            # Record what we expect before the coordinator applies the result,
+            # so the optimistic update is not mistaken for an app-side change
+            self._sent_pattern = (command.pattern_type, command.colors)
+
+            try:
+                success = await self.coordinator.async_send_command(
+                    zones, command, force=self._pending_command_force
+                )
+            except CommandSuperseded as err:
+                if not future.done():
+                    future.set_exception(err)
+                return
+            if not future.done():
+                future.set_result(success)
 
         except asyncio.CancelledError:
             pass
-        except asyncio.TimeoutError:
-            _LOGGER.warning("Timeout sending command to Oelo controller")
-            if self._pending_command_future and not self._pending_command_future.done():
-                self._pending_command_future.set_result(False)
-        except aiohttp.ClientError as err:
-            _LOGGER.warning("Error sending command to Oelo controller: %s", err)
-            if self._pending_command_future and not self._pending_command_future.done():
-                self._pending_command_future.set_result(False)
-        except Exception as err:  # noqa: BLE001
-            _LOGGER.exception("Unexpected error sending command: %s", err)
-            if self._pending_command_future and not self._pending_command_future.done():
-                self._pending_command_future.set_result(False)
\ No newline at end of file
+
+
+def _command_from_stored(value: Any) -> SetPatternCommand | None:
+    """Restore a stored command.
+
+    Older versions stored the setPattern URL or payload as a string; its
+    colors are taken as the base colors.
+    """
+    try:
+        if isinstance(value, dict):
+            return SetPatternCommand.from_dict(value)
+        if isinstance(value, str) and value:
+            return SetPatternCommand.from_query(value)
+    except (KeyError, IndexError, TypeError, ValueError) as err:
+        _LOGGER.debug("Ignoring invalid stored command %s: %s", value, err)
+    return None
\ No newline at end of file
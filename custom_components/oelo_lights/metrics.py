@@ -0,0 +1,76 @@
+"""Request metrics for Oelo Lights integration."""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+import math
+from typing import Any
+
+from .const import METRICS_WINDOW_SIZE
+
+
+class LatencySamples:
+    """Sliding window of latency samples summarized by percentiles."""
+
+    def __init__(self, size: int = METRICS_WINDOW_SIZE) -> None:
+        """Initialize the window."""
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def add(self, seconds: float) -> None:
+        """Record a latency sample."""
+        self._samples.append(seconds)
+
+    @property
+    def last(self) -> float | None:
+        """Return the most recent sample in seconds."""
+        return self._samples[-1] if self._samples else None
+
+    def percentile(self, percent: float) -> float | None:
+        """Return the nearest-rank percentile of the window in seconds."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+        return ordered[rank - 1]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a summary of the window in milliseconds."""
+        return {
+            "count": len(self._samples),
+            "last": to_milliseconds(self.last),
+            "p50": to_milliseconds(self.percentile(50)),
+            "p95": to_milliseconds(self.percentile(95)),
+            "p99": to_milliseconds(self.percentile(99)),
+        }
+
+
+@dataclass(slots=True)
+class OeloMetrics:
+    """Latency and error counters of one controller."""
+
+    command_rtt: LatencySamples = field(default_factory=LatencySamples)
+    poll_rtt: LatencySamples = field(default_factory=LatencySamples)
+    command_timeouts: int = 0
+    command_errors: int = 0
+    poll_timeouts: int = 0
+    poll_errors: int = 0
+    debounce_cancels: int = 0
+    rejected_commands: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics for diagnostics."""
+        return {
+            "command_rtt_ms": self.command_rtt.as_dict(),
+            "poll_rtt_ms": self.poll_rtt.as_dict(),
+            "command_timeouts": self.command_timeouts,
+            "command_errors": self.command_errors,
+            "poll_timeouts": self.poll_timeouts,
+            "poll_errors": self.poll_errors,
+            "debounce_cancels": self.debounce_cancels,
+            "rejected_commands": self.rejected_commands,
+        }
+
+
+def to_milliseconds(seconds: float | None) -> float | None:
+    """Convert seconds to rounded milliseconds."""
+    return None if seconds is None else round(seconds * 1000, 1)
@@ -0,0 +1,130 @@
+"""setPattern command model for Oelo Lights integration."""
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, replace
+from functools import lru_cache
+import urllib.parse
+from typing import Any
+
+from .colors import RGBColor, encode_colors, scale_colors
+from .const import MAX_COLORS, MAX_GAP, MAX_SPEED, PATTERN_TYPE_OFF
+
+
+@dataclass(frozen=True, slots=True)
+class SetPatternCommand:
+    """Zone-independent settings of a setPattern request.
+
+    Commands are validated on creation and compare and hash by value, so they
+    can be used directly as keys for deduplication, caching and coalescing.
+    Zones are added by the coordinator when the command is sent.
+    """
+
+    pattern_type: str
+    colors: tuple[RGBColor, ...]
+    speed: int = 0
+    gap: int = 0
+    direction: str = "F"
+
+    def __post_init__(self) -> None:
+        """Validate the command fields."""
+        if not self.pattern_type or not isinstance(self.pattern_type, str):
+            raise ValueError("Pattern type is required")
+        if not 0 < len(self.colors) <= MAX_COLORS:
+            raise ValueError(f"Between 1 and {MAX_COLORS} colors are required")
+        for rgb in self.colors:
+            if len(rgb) != 3 or not all(0 <= c <= 255 for c in rgb):
+                raise ValueError(f"Invalid color {rgb}")
+        if not 0 <= self.speed <= MAX_SPEED:
+            raise ValueError(f"Speed must be between 0 and {MAX_SPEED}")
+        if not 0 <= self.gap <= MAX_GAP:
+            raise ValueError(f"Gap must be between 0 and {MAX_GAP}")
+
+    @classmethod
+    def from_input(
+        cls,
+        pattern_type: str,
+        colors: Iterable[Any],
+        speed: int = 0,
+        gap: int = 0,
+    ) -> SetPatternCommand:
+        """Build a command from loosely typed input such as service data.
+
+        Colors may be any sequences of at least three numbers; channels are
+        clamped to 0-255 and only the first MAX_COLORS colors are kept.
+        """
+        validated: list[RGBColor] = []
+        for color in colors:
+            if not isinstance(color, (list, tuple)) or len(color) < 3:
+                raise ValueError(f"Invalid color {color}")
+            try:
+                validated.append((int(color[0]), int(color[1]), int(color[2])))
+            except (ValueError, TypeError) as err:
+                raise ValueError(f"Invalid color {color}") from err
+        return cls(pattern_type, scale_colors(validated), int(speed), int(gap))
+
+    @classmethod
+    def from_dict(cls, value: Mapping[str, Any]) -> SetPatternCommand:
+        """Restore a command from its stored form."""
+        return cls.from_input(
+            str(value["pattern_type"]),
+            value["colors"],
+            int(value.get("speed", 0)),
+            int(value.get("gap", 0)),
+        )
+
+    @classmethod
+    def from_query(cls, query: str) -> SetPatternCommand:
+        """Parse a setPattern URL or query string."""
+        if "?" in query:
+            query = urllib.parse.urlparse(query).query
+        params = dict(urllib.parse.parse_qsl(query))
+        values = [int(c) for c in params["colors"].split(",")]
+        return cls.from_input(
+            params["patternType"],
+            (values[i : i + 3] for i in range(0, len(values) - 2, 3)),
+            int(params.get("speed", 0)),
+            int(params.get("gap", 0)),
+        )
+
+    @classmethod
+    def off(cls) -> SetPatternCommand:
+        """Return the command that turns zones off."""
+        return _OFF_COMMAND
+
+    def scaled(self, brightness: int) -> SetPatternCommand:
+        """Return the command with its colors scaled to a brightness level."""
+        if brightness >= 255:
+            return self
+        return replace(self, colors=scale_colors(self.colors, brightness))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the command in its stored form."""
+        return {
+            "pattern_type": self.pattern_type,
+            "colors": [list(rgb) for rgb in self.colors],
+            "speed": self.speed,
+            "gap": self.gap,
+        }
+
+    def to_query(self) -> str:
+        """Return the encoded setPattern query string, without zones."""
+        return _encode_command(self)
+
+
+@lru_cache(maxsize=256)
+def _encode_command(command: SetPatternCommand) -> str:
+    """Encode a command; cached since the same commands are sent repeatedly."""
+    return urllib.parse.urlencode({
+        "patternType": command.pattern_type,
+        "num_colors": len(command.colors),
+        "colors": encode_colors(command.colors),
+        "direction": command.direction,
+        "speed": command.speed,
+        "gap": command.gap,
+        "other": 0,
+        "pause": 0,
+    })
+
+
+_OFF_COMMAND = SetPatternCommand(PATTERN_TYPE_OFF, ((0, 0, 0),))
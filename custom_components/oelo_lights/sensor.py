@@ -0,0 +1,145 @@
+"""Diagnostic sensors for Oelo Lights integration."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+from .coordinator import OeloDataUpdateCoordinator, controller_device_info
+from .metrics import to_milliseconds
+
+# Metrics are read from memory, so polling them does not touch the controller
+SCAN_INTERVAL = timedelta(seconds=60)
+
+
+@dataclass(frozen=True, kw_only=True)
+class OeloSensorEntityDescription(SensorEntityDescription):
+    """Describes an Oelo diagnostic sensor."""
+
+    value_fn: Callable[[OeloDataUpdateCoordinator], float | int | None]
+
+
+LATENCY_SENSOR = {
+    "device_class": SensorDeviceClass.DURATION,
+    "native_unit_of_measurement": UnitOfTime.MILLISECONDS,
+    "state_class": SensorStateClass.MEASUREMENT,
+}
+
+SENSORS: tuple[OeloSensorEntityDescription, ...] = (
+    OeloSensorEntityDescription(
+        key="command_latency_p50",
+        name="Command latency p50",
+        value_fn=lambda c: to_milliseconds(c.metrics.command_rtt.percentile(50)),
+        **LATENCY_SENSOR,
+    ),
+    OeloSensorEntityDescription(
+        key="command_latency_p95",
+        name="Command latency p95",
+        value_fn=lambda c: to_milliseconds(c.metrics.command_rtt.percentile(95)),
+        **LATENCY_SENSOR,
+    ),
+    OeloSensorEntityDescription(
+        key="command_latency_p99",
+        name="Command latency p99",
+        value_fn=lambda c: to_milliseconds(c.metrics.command_rtt.percentile(99)),
+        **LATENCY_SENSOR,
+    ),
+    OeloSensorEntityDescription(
+        key="poll_latency",
+        name="Poll latency",
+        value_fn=lambda c: to_milliseconds(c.metrics.poll_rtt.percentile(50)),
+        **LATENCY_SENSOR,
+    ),
+    OeloSensorEntityDescription(
+        key="command_timeouts",
+        name="Command timeouts",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda c: c.metrics.command_timeouts,
+    ),
+    OeloSensorEntityDescription(
+        key="command_errors",
+        name="Command errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda c: c.metrics.command_errors,
+    ),
+    OeloSensorEntityDescription(
+        key="poll_timeouts",
+        name="Poll timeouts",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda c: c.metrics.poll_timeouts,
+    ),
+    OeloSensorEntityDescription(
+        key="poll_errors",
+        name="Poll errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda c: c.metrics.poll_errors,
+    ),
+    OeloSensorEntityDescription(
+        key="debounce_cancels",
+        name="Debounced commands",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda c: c.metrics.debounce_cancels,
+    ),
+    OeloSensorEntityDescription(
+        key="rejected_commands",
+        name="Rejected commands",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda c: c.metrics.rejected_commands,
+    ),
+    OeloSensorEntityDescription(
+        key="queue_depth",
+        name="Request queue depth",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda c: c.dispatcher.queue_depth,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Oelo diagnostic sensors from a config entry."""
+    coordinator: OeloDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    async_add_entities(
+        OeloDiagnosticSensor(coordinator, entry, description) for description in SENSORS
+    )
+
+
+class OeloDiagnosticSensor(SensorEntity):
+    """Request metric of an Oelo controller."""
+
+    entity_description: OeloSensorEntityDescription
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        coordinator: OeloDataUpdateCoordinator,
+        entry: ConfigEntry,
+        description: OeloSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.coordinator = coordinator
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_device_info = controller_device_info(entry, coordinator.ip)
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the current metric value."""
+        return self.entity_description.value_fn(self.coordinator)
@@ -0,0 +1,341 @@
+"""Domain services for Oelo Lights integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping
+import logging
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+
+from .const import (
+    DOMAIN,
+    FLEET_MAX_CONCURRENCY,
+    MAX_COLORS,
+    MAX_GAP,
+    MAX_SPEED,
+    MODE_CUSTOM,
+    MODE_PRESET,
+    PATTERN_TYPE_CUSTOM,
+)
+from .coordinator import OeloDataUpdateCoordinator
+from .dispatcher import CommandSuperseded
+from .patterns import get_preset_command
+from .protocol import SetPatternCommand
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_CONTROL_LIGHTS = "control_lights"
+SERVICE_CONTROL_FLEET = "control_fleet"
+SERVICE_SNAPSHOT = "snapshot"
+SERVICE_RESTORE = "restore"
+
+DEFAULT_SNAPSHOT_ID = "default"
+
+# Fields shared by the control_lights entity service and the fleet service
+CONTROL_LIGHTS_FIELDS: dict[vol.Marker, Any] = {
+    vol.Required("mode"): vol.In([MODE_PRESET, MODE_CUSTOM]),
+    vol.Optional("target_zones"): cv.ensure_list,
+    vol.Optional("preset_name"): cv.string,
+    vol.Optional("custom_pattern_type", default=PATTERN_TYPE_CUSTOM): cv.string,
+    vol.Optional("colors"): vol.All(cv.ensure_list, vol.Length(max=MAX_COLORS)),
+    vol.Optional("speed", default=1): vol.All(
+        vol.Coerce(int), vol.Range(min=0, max=MAX_SPEED)
+    ),
+    vol.Optional("gap", default=0): vol.All(
+        vol.Coerce(int), vol.Range(min=0, max=MAX_GAP)
+    ),
+    vol.Optional("force", default=False): cv.boolean,
+}
+
+FLEET_SERVICE_SCHEMA = vol.Schema(
+    cv.make_entity_service_schema(
+        {
+            **CONTROL_LIGHTS_FIELDS,
+            vol.Optional("synchronized", default=False): cv.boolean,
+        }
+    )
+)
+
+
+SNAPSHOT_SERVICE_SCHEMA = vol.Schema(
+    cv.make_entity_service_schema(
+        {
+            vol.Optional("snapshot_id", default=DEFAULT_SNAPSHOT_ID): cv.string,
+            vol.Optional("target_zones"): cv.ensure_list,
+        }
+    )
+)
+
+RESTORE_SERVICE_SCHEMA = vol.Schema(
+    cv.make_entity_service_schema(
+        {
+            vol.Optional("snapshot_id", default=DEFAULT_SNAPSHOT_ID): cv.string,
+            vol.Optional("force", default=False): cv.boolean,
+        }
+    )
+)
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the domain services."""
+    if hass.services.has_service(DOMAIN, SERVICE_CONTROL_FLEET):
+        return
+
+    # Shared by all calls so overlapping fleet calls respect one cap
+    semaphore = asyncio.Semaphore(FLEET_MAX_CONCURRENCY)
+
+    async def handle_control_fleet(call: ServiceCall) -> ServiceResponse:
+        """Send one command to lights on any number of controllers in parallel."""
+        command = _command_from_service_data(call.data)
+        targets = _async_group_targets(hass, call)
+        if not targets:
+            raise ServiceValidationError("No Oelo lights were targeted")
+
+        if override := call.data.get("target_zones"):
+            zones_override = sorted({int(z) for z in override})
+            targets = {entry_id: zones_override for entry_id in targets}
+
+        if call.data["synchronized"]:
+            return await _async_send_synchronized(hass, targets, command)
+
+        force = call.data["force"]
+
+        async def async_send(entry_id: str, zones: list[int]) -> dict[str, Any]:
+            coordinator: OeloDataUpdateCoordinator = hass.data[DOMAIN][entry_id][
+                "coordinator"
+            ]
+            async with semaphore:
+                try:
+                    success = await coordinator.async_send_command(zones, command, force)
+                except CommandSuperseded:
+                    _LOGGER.info(
+                        "Command to %s was replaced by a newer one", coordinator.name
+                    )
+                    success = False
+                else:
+                    if not success:
+                        _LOGGER.error("Failed to send command to %s", coordinator.name)
+            return {
+                "entry_id": entry_id,
+                "name": coordinator.name,
+                "zones": zones,
+                "success": success,
+            }
+
+        results = await asyncio.gather(
+            *(async_send(entry_id, zones) for entry_id, zones in targets.items())
+        )
+        return {"controllers": list(results)}
+
+    async def handle_snapshot(call: ServiceCall) -> ServiceResponse:
+        """Capture the zone state of the targeted controllers."""
+        targets = _async_group_targets(hass, call)
+        if not targets:
+            raise ServiceValidationError("No Oelo lights were targeted")
+        if override := call.data.get("target_zones"):
+            zones_override = sorted({int(z) for z in override})
+            targets = {entry_id: zones_override for entry_id in targets}
+
+        snapshot_id = call.data["snapshot_id"]
+        captured: dict[str, Any] = {}
+        for entry_id, zones in targets.items():
+            coordinator: OeloDataUpdateCoordinator = hass.data[DOMAIN][entry_id][
+                "coordinator"
+            ]
+            snapshot = coordinator.async_snapshot(zones)
+            coordinator.snapshots[snapshot_id] = snapshot
+            captured[entry_id] = {
+                zone: command.as_dict() for zone, command in snapshot.items()
+            }
+        return {"snapshot_id": snapshot_id, "controllers": captured}
+
+    async def handle_restore(call: ServiceCall) -> ServiceResponse:
+        """Restore a snapshot on the targeted controllers in one pass."""
+        snapshot_id = call.data["snapshot_id"]
+        coordinators: dict[str, OeloDataUpdateCoordinator] = {
+            entry_id: hass.data[DOMAIN][entry_id]["coordinator"]
+            for entry_id in _async_group_targets(hass, call)
+        }
+        snapshots = {
+            entry_id: snapshot
+            for entry_id, coordinator in coordinators.items()
+            if (snapshot := coordinator.snapshots.get(snapshot_id))
+        }
+        if not snapshots:
+            raise ServiceValidationError(f"No snapshot '{snapshot_id}' to restore")
+
+        async def async_restore(entry_id: str) -> dict[str, Any]:
+            coordinator = coordinators[entry_id]
+            async with semaphore:
+                success, requests = await coordinator.async_restore(
+                    snapshots[entry_id], call.data["force"]
+                )
+            if not success:
+                _LOGGER.error("Failed to restore snapshot on %s", coordinator.name)
+            return {
+                "entry_id": entry_id,
+                "name": coordinator.name,
+                "zones": sorted(snapshots[entry_id]),
+                "requests": requests,
+                "success": success,
+            }
+
+        results = await asyncio.gather(*(async_restore(entry_id) for entry_id in snapshots))
+        return {"controllers": list(results)}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CONTROL_FLEET,
+        handle_control_fleet,
+        schema=FLEET_SERVICE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SNAPSHOT,
+        handle_snapshot,
+        schema=SNAPSHOT_SERVICE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RESTORE,
+        handle_restore,
+        schema=RESTORE_SERVICE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove the domain services and the entity service of the light platform."""
+    for service in (
+        SERVICE_CONTROL_FLEET,
+        SERVICE_SNAPSHOT,
+        SERVICE_RESTORE,
+        SERVICE_CONTROL_LIGHTS,
+    ):
+        hass.services.async_remove(DOMAIN, service)
+
+
+async def _async_send_synchronized(
+    hass: HomeAssistant,
+    targets: Mapping[str, list[int]],
+    command: SetPatternCommand,
+) -> ServiceResponse:
+    """Start a command on several controllers at the same moment.
+
+    Every controller is polled first, which warms its connection, and its
+    request is built. The prepared requests are then released together,
+    bypassing the concurrency cap, and the spread of their start times is
+    reported as the start skew. Zones already running the command are
+    sent it too, so their animation restarts in step with the rest.
+    """
+    coordinators: dict[str, OeloDataUpdateCoordinator] = {
+        entry_id: hass.data[DOMAIN][entry_id]["coordinator"] for entry_id in targets
+    }
+    prepared = await asyncio.gather(
+        *(
+            coordinators[entry_id].async_prepare_command(zones, command)
+            for entry_id, zones in targets.items()
+        )
+    )
+
+    ready = {
+        entry_id: item
+        for entry_id, item in zip(targets, prepared)
+        if item is not None
+    }
+    sent = await asyncio.gather(
+        *(
+            coordinators[entry_id].async_send_prepared(item)
+            for entry_id, item in ready.items()
+        )
+    )
+    outcomes = dict(zip(ready, sent))
+
+    starts = [started for _, started in sent if started is not None]
+    first = min(starts, default=None)
+    results: list[dict[str, Any]] = []
+    for entry_id, zones in targets.items():
+        success, started = outcomes.get(entry_id, (False, None))
+        if not success:
+            _LOGGER.error("Failed to send command to %s", coordinators[entry_id].name)
+        results.append(
+            {
+                "entry_id": entry_id,
+                "name": coordinators[entry_id].name,
+                "zones": zones,
+                "success": success,
+                "start_offset_ms": (
+                    None if started is None or first is None
+                    else round((started - first) * 1000, 2)
+                ),
+            }
+        )
+
+    skew = max(starts) - first if first is not None else None
+    _LOGGER.debug("Synchronized start of %d controllers, skew %s", len(starts), skew)
+    return {
+        "controllers": results,
+        "start_skew_ms": None if skew is None else round(skew * 1000, 2),
+    }
+
+
+def _command_from_service_data(data: Mapping[str, Any]) -> SetPatternCommand:
+    """Build the command described by control service data."""
+    speed = data.get("speed", 1)
+    gap = data.get("gap", 0)
+
+    if data["mode"] == MODE_PRESET:
+        if not (preset_name := data.get("preset_name")):
+            raise ServiceValidationError("Preset name required for Preset mode")
+        command = get_preset_command(
+            preset_name,
+            speed=speed if speed != 1 else None,
+            gap=gap if gap != 0 else None,
+        )
+        if not command:
+            raise ServiceValidationError(f"Preset '{preset_name}' not found")
+        return command
+
+    if not (colors := data.get("colors")):
+        raise ServiceValidationError("Colors required for Custom mode")
+    try:
+        return SetPatternCommand.from_input(
+            data.get("custom_pattern_type", PATTERN_TYPE_CUSTOM), colors, speed, gap
+        )
+    except ValueError as err:
+        raise ServiceValidationError(f"Invalid colors provided: {err}") from err
+
+
+def _async_group_targets(hass: HomeAssistant, call: ServiceCall) -> dict[str, list[int]]:
+    """Resolve targeted entities, devices and areas to zones per config entry."""
+    selected = async_extract_referenced_entity_ids(hass, call)
+    registry = er.async_get(hass)
+    loaded = hass.data.get(DOMAIN, {})
+
+    targets: dict[str, set[int]] = {}
+    for entity_id in selected.referenced | selected.indirectly_referenced:
+        entity_entry = registry.async_get(entity_id)
+        if (
+            entity_entry is None
+            or entity_entry.platform != DOMAIN
+            or entity_entry.domain != "light"
+            or entity_entry.config_entry_id not in loaded
+        ):
+            continue
+        _, _, zone = entity_entry.unique_id.rpartition("_zone_")
+        targets.setdefault(entity_entry.config_entry_id, set()).add(int(zone))
+
+    return {entry_id: sorted(zones) for entry_id, zones in targets.items()}
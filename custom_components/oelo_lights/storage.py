@@ -0,0 +1,67 @@
+"""Persistent entity data for Oelo Lights integration."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import STORAGE_KEY_BASE, STORAGE_SAVE_DELAY, STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class OeloEntityStore:
+    """Entity data of one controller, written to disk in batches.
+
+    Changes are collected in memory and written at most once every
+    STORAGE_SAVE_DELAY seconds. Home Assistant writes a pending batch when
+    it stops, and the integration flushes it when the entry is unloaded.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{STORAGE_KEY_BASE}_{entry_id}"
+        )
+        self.data: dict[str, Any] = {}
+        self._save_scheduled = False
+
+    async def async_load(self) -> dict[str, Any]:
+        """Load the stored data."""
+        self.data = await self._store.async_load() or {}
+        return self.data
+
+    @callback
+    def async_set(self, key: str, value: Any) -> None:
+        """Set a value and schedule a write if it changed."""
+        if value is None:
+            if self.data.pop(key, None) is None:
+                return
+        elif self.data.get(key) == value:
+            return
+        else:
+            self.data[key] = value
+
+        if not self._save_scheduled:
+            # Later changes are picked up by the pending write without
+            # pushing it back
+            self._save_scheduled = True
+            self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data for a delayed write."""
+        self._save_scheduled = False
+        return self.data
+
+    async def async_flush(self) -> None:
+        """Write pending changes immediately."""
+        if not self._save_scheduled:
+            return
+        self._save_scheduled = False
+        try:
+            await self._store.async_save(self.data)
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.warning("Failed to save entity data to storage: %s", err)
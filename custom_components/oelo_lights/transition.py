@@ -0,0 +1,60 @@
+"""Client-side transitions for Oelo Lights integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import replace
+import logging
+
+from .colors import RGBColor, blend_colors
+from .protocol import SetPatternCommand
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_run_transition(
+    start_colors: Sequence[RGBColor],
+    target: SetPatternCommand,
+    duration: float,
+    send_frame: Callable[[SetPatternCommand], Awaitable[bool]],
+    frame_interval: Callable[[], float],
+    final: SetPatternCommand | None = None,
+) -> bool:
+    """Fade from the start colors to the target command over a duration.
+
+    Each frame is the target command with its colors blended by elapsed
+    time. Frames are paced by ``frame_interval``, which is read again after
+    every frame so the rate follows the controller's measured latency, and
+    a frame that arrives late simply skips the intermediate ones. The
+    ``final`` command, the target by default, is sent once the fade ends.
+    """
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    ends = started + duration
+    # The zone already shows the start colors, so the first frame is skipped
+    last_frame = replace(target, colors=blend_colors(start_colors, target.colors, 0.0))
+    sent = dropped = 0
+
+    while (now := loop.time()) < ends:
+        frame = replace(
+            target,
+            colors=blend_colors(start_colors, target.colors, (now - started) / duration),
+        )
+        if frame != last_frame:
+            if not await send_frame(frame):
+                return False
+            last_frame = frame
+            sent += 1
+
+        interval = frame_interval()
+        next_frame = now + interval
+        if (after := loop.time()) > next_frame:
+            # The controller is lagging; skip the frames that are already due
+            dropped += int((after - next_frame) / interval)
+            next_frame = after
+        await asyncio.sleep(min(next_frame, ends) - loop.time())
+
+    _LOGGER.debug(
+        "Transition over %.1fs sent %d frames, dropped %d", duration, sent, dropped
+    )
+    return await send_frame(final or target)
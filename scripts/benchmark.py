@@ -0,0 +1,296 @@
+"""Benchmarks for the Oelo Lights command and polling paths.
+
+Micro benchmarks time command construction, encoding and color scaling.
+End-to-end benchmarks drive a coordinator against the simulated controller
+from ``oelo_simulator.py`` and time a six-zone scene and the path from a
+poll to a light entity writing its new state.
+
+Every result is compared against a fixed threshold, and optionally against
+a saved baseline; the script exits non-zero when anything regressed::
+
+    python scripts/benchmark.py --save baseline.json
+    python scripts/benchmark.py --baseline baseline.json --tolerance 0.2
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import tempfile
+import time
+import timeit
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import aiohttp
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from homeassistant.config_entries import ConfigEntry  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers import restore_state  # noqa: E402
+
+from custom_components.oelo_lights.colors import scale_colors  # noqa: E402
+from custom_components.oelo_lights.const import DOMAIN  # noqa: E402
+from custom_components.oelo_lights.coordinator import (  # noqa: E402
+    OeloDataUpdateCoordinator,
+)
+from custom_components.oelo_lights.light import OeloLight  # noqa: E402
+from custom_components.oelo_lights.patterns import (  # noqa: E402
+    get_preset_command,
+    get_preset_names,
+)
+from custom_components.oelo_lights.protocol import (  # noqa: E402
+    SetPatternCommand,
+    _encode_command,
+)
+from oelo_simulator import OeloSimulator  # noqa: E402
+
+# Simulated controller timing; fixed so end-to-end results are comparable
+POLL_LATENCY = 0.02
+COMMAND_LATENCY = 0.05
+
+# Upper bounds, in microseconds per call for micro benchmarks and in
+# milliseconds (median) for end-to-end benchmarks. Micro bounds are loose
+# enough for slow machines and only catch step changes; compare against a
+# baseline from the same machine to catch smaller regressions
+THRESHOLDS: dict[str, float] = {
+    "command_from_input": 200.0,
+    "command_encode": 150.0,
+    "command_encode_cached": 5.0,
+    "command_scaled": 150.0,
+    "preset_command": 2.0,
+    "scale_colors": 120.0,
+    "build_command_url": 50.0,
+    # Six distinct commands are serialized on the single connection, so the
+    # floor is 6 * COMMAND_LATENCY plus the coalescing window
+    "scene_distinct_6_zones": 6 * COMMAND_LATENCY * 1000 + 150,
+    # One coalesced request covers all six zones
+    "scene_uniform_6_zones": COMMAND_LATENCY * 1000 + 100,
+    "poll_to_state_write": POLL_LATENCY * 1000 + 20,
+}
+
+_COLORS = [[(i * 37) % 256, (i * 91) % 256, (i * 53) % 256] for i in range(20)]
+
+
+@dataclass
+class BenchmarkResult:
+    """The timing of one benchmark."""
+
+    name: str
+    unit: str
+    value: float
+    p95: float | None = None
+
+    def format(self) -> str:
+        """Return the result as a table row."""
+        p95 = f"{self.p95:10.3f}" if self.p95 is not None else " " * 10
+        return f"{self.name:<26} {self.value:10.3f} {p95}  {self.unit}"
+
+
+def _time_call(name: str, func: Callable[[], object], number: int) -> BenchmarkResult:
+    """Time a call, keeping the best of several repeats."""
+    best = min(timeit.repeat(func, number=number, repeat=5))
+    return BenchmarkResult(name, "us/call", best / number * 1e6)
+
+
+def _summarize(name: str, samples: list[float]) -> BenchmarkResult:
+    """Summarize latency samples, in seconds, as milliseconds."""
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return BenchmarkResult(name, "ms", statistics.median(ordered) * 1000, p95 * 1000)
+
+
+def run_micro_benchmarks() -> list[BenchmarkResult]:
+    """Time the pure command building and color functions."""
+    command = SetPatternCommand.from_input("custom", _COLORS, 10, 2)
+    preset = get_preset_names()[0]
+    encode = _encode_command.__wrapped__
+    return [
+        _time_call(
+            "command_from_input",
+            lambda: SetPatternCommand.from_input("custom", _COLORS, 10, 2),
+            10_000,
+        ),
+        _time_call("command_encode", lambda: encode(command), 10_000),
+        _time_call("command_encode_cached", command.to_query, 100_000),
+        _time_call("command_scaled", lambda: command.scaled(128), 10_000),
+        _time_call("preset_command", lambda: get_preset_command(preset), 100_000),
+        _time_call("scale_colors", lambda: scale_colors(_COLORS, 128), 10_000),
+    ]
+
+
+async def _async_scene_latency(
+    coordinator: OeloDataUpdateCoordinator, distinct: bool, rounds: int
+) -> list[float]:
+    """Time applying a scene to all six zones, alternating between two scenes."""
+    samples = []
+    for i in range(rounds):
+        base = (i % 2) * 100
+        commands = {
+            zone: SetPatternCommand(
+                "custom", ((base + (zone if distinct else 0), 0, 255 - base),)
+            )
+            for zone in range(1, 7)
+        }
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(coordinator.async_send_command([zone], cmd) for zone, cmd in commands.items())
+        )
+        samples.append(time.perf_counter() - start)
+        if not all(results):
+            raise RuntimeError("Scene command failed against the simulator")
+    return samples
+
+
+async def _async_add_light(
+    hass: HomeAssistant, coordinator: OeloDataUpdateCoordinator
+) -> OeloLight:
+    """Add a zone 1 light without a platform, the minimum for state writes."""
+    # The light would warn that it was added without an entity platform
+    logging.getLogger("homeassistant.helpers.entity").setLevel(logging.ERROR)
+    await restore_state.async_load(hass)
+    entry = ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        title="Benchmark",
+        data={},
+        source="user",
+        options={},
+    )
+    light = OeloLight(coordinator, 1, entry)
+    light.hass = hass
+    light.entity_id = "light.benchmark_zone_1"
+    await light.async_added_to_hass()
+    return light
+
+
+async def _async_poll_latency(
+    hass: HomeAssistant,
+    coordinator: OeloDataUpdateCoordinator,
+    simulator: OeloSimulator,
+    rounds: int,
+) -> list[float]:
+    """Time a poll that observes a change until the light writes its state."""
+    light = await _async_add_light(hass, coordinator)
+    samples = []
+    try:
+        for i in range(rounds):
+            simulator.zones[1].update(pattern="custom", colorStr=f"{i % 256},0,0")
+            start = time.time()
+            await coordinator.async_refresh()
+            state = hass.states.get(light.entity_id)
+            if state is None or state.attributes.get("rgb_color") != (i % 256, 0, 0):
+                raise RuntimeError("Poll did not update the light's state")
+            samples.append(state.last_updated.timestamp() - start)
+    finally:
+        await light.async_will_remove_from_hass()
+    return samples
+
+
+async def async_run_end_to_end_benchmarks(rounds: int) -> list[BenchmarkResult]:
+    """Drive a coordinator against the simulated controller."""
+    simulator = OeloSimulator(
+        poll_latency=POLL_LATENCY, command_latency=COMMAND_LATENCY, jitter=0.0
+    )
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        async with simulator, aiohttp.ClientSession() as session:
+            coordinator = OeloDataUpdateCoordinator(hass, session, simulator.address)
+            await coordinator.async_refresh()
+            command = SetPatternCommand.from_input("custom", _COLORS)
+            results = [
+                _time_call(
+                    "build_command_url",
+                    lambda: coordinator.build_command_url(range(1, 7), command),
+                    10_000,
+                ),
+                _summarize(
+                    "scene_distinct_6_zones",
+                    await _async_scene_latency(coordinator, True, rounds),
+                ),
+                _summarize(
+                    "scene_uniform_6_zones",
+                    await _async_scene_latency(coordinator, False, rounds),
+                ),
+                _summarize(
+                    "poll_to_state_write",
+                    await _async_poll_latency(hass, coordinator, simulator, rounds),
+                ),
+            ]
+            await coordinator.async_shutdown()
+        await hass.async_stop(force=True)
+    return results
+
+
+def find_regressions(
+    results: list[BenchmarkResult],
+    baseline: dict[str, float] | None,
+    tolerance: float,
+) -> list[str]:
+    """Return a description of every result over its threshold or baseline."""
+    regressions = []
+    for result in results:
+        limit = THRESHOLDS.get(result.name)
+        if limit is not None and result.value > limit:
+            regressions.append(
+                f"{result.name}: {result.value:.3f} {result.unit} exceeds "
+                f"threshold {limit:.3f}"
+            )
+        if baseline and result.name in baseline:
+            allowed = baseline[result.name] * (1 + tolerance)
+            if result.value > allowed:
+                regressions.append(
+                    f"{result.name}: {result.value:.3f} {result.unit} is over "
+                    f"{tolerance:.0%} slower than baseline {baseline[result.name]:.3f}"
+                )
+    return regressions
+
+
+def main() -> int:
+    """Run the benchmarks and report regressions."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--baseline", type=Path, help="results file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--save", type=Path, help="write results to a file")
+    parser.add_argument(
+        "--micro-only",
+        action="store_true",
+        help="skip the benchmarks that need the simulator",
+    )
+    args = parser.parse_args()
+
+    results = run_micro_benchmarks()
+    if not args.micro_only:
+        results += asyncio.run(async_run_end_to_end_benchmarks(args.rounds))
+
+    print(f"{'benchmark':<26} {'value':>10} {'p95':>10}")
+    for result in results:
+        print(result.format())
+
+    if args.save:
+        args.save.write_text(
+            json.dumps([asdict(result) for result in results], indent=2)
+        )
+
+    baseline = None
+    if args.baseline:
+        baseline = {
+            item["name"]: item["value"]
+            for item in json.loads(args.baseline.read_text())
+        }
+
+    regressions = find_regressions(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
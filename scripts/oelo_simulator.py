@@ -0,0 +1,252 @@
+"""Simulated Oelo controller for development and load testing.
+
+Serves ``/getController`` and ``/setPattern`` the way the controller firmware
+does, including its slow responses, its single-connection limit and the odd
+dropped request, so the integration can be exercised without hardware.
+
+Run standalone::
+
+    python scripts/oelo_simulator.py --host 127.0.0.1 --port 8080
+
+or use it from an async test::
+
+    async with OeloSimulator(latency=0.05) as sim:
+        ...  # point the integration at sim.address
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import random
+from dataclasses import dataclass, field
+from typing import Any
+
+from aiohttp import web
+
+_LOGGER = logging.getLogger(__name__)
+
+NUM_ZONES = 6
+
+# Default response delays, in seconds; override them to match the setup under test
+DEFAULT_POLL_LATENCY = 0.08
+DEFAULT_COMMAND_LATENCY = 0.25
+DEFAULT_JITTER = 0.03
+
+
+@dataclass
+class SimulatorStats:
+    """Counters describing the traffic a simulator has served."""
+
+    polls: int = 0
+    commands: int = 0
+    dropped: int = 0
+    queued: int = 0
+    max_waiting: int = 0
+    commands_per_zone: dict[int, int] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters in a printable form."""
+        return {
+            "polls": self.polls,
+            "commands": self.commands,
+            "dropped": self.dropped,
+            "queued": self.queued,
+            "max_waiting": self.max_waiting,
+            "commands_per_zone": dict(sorted(self.commands_per_zone.items())),
+        }
+
+
+def _initial_zone(num: int) -> dict[str, Any]:
+    """Return the state of a zone that has never been set."""
+    return {
+        "num": num,
+        "pattern": "off",
+        "colorStr": "0,0,0",
+        "speed": 0,
+        "gap": 0,
+        "direction": "F",
+    }
+
+
+class OeloSimulator:
+    """A fake Oelo controller served by aiohttp."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        num_zones: int = NUM_ZONES,
+        poll_latency: float = DEFAULT_POLL_LATENCY,
+        command_latency: float = DEFAULT_COMMAND_LATENCY,
+        jitter: float = DEFAULT_JITTER,
+        drop_rate: float = 0.0,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the simulator; port 0 picks a free port on start."""
+        self.host = host
+        self.port = port
+        self.poll_latency = poll_latency
+        self.command_latency = command_latency
+        self.jitter = jitter
+        self.drop_rate = drop_rate
+        self.zones: dict[int, dict[str, Any]] = {
+            num: _initial_zone(num) for num in range(1, num_zones + 1)
+        }
+        self.stats = SimulatorStats()
+        self._random = random.Random(seed)
+        # The controller firmware handles a single connection at a time and
+        # queues everything else behind it
+        self._busy = asyncio.Lock()
+        self._waiting = 0
+        self._runner: web.AppRunner | None = None
+
+    @property
+    def address(self) -> str:
+        """Return the host:port the integration should be pointed at."""
+        return f"{self.host}:{self.port}"
+
+    async def start(self) -> None:
+        """Start serving requests."""
+        app = web.Application()
+        app.router.add_get("/getController", self._handle_get_controller)
+        app.router.add_get("/setPattern", self._handle_set_pattern)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        if not self.port:
+            self.port = self._runner.addresses[0][1]
+        _LOGGER.info("Simulated Oelo controller listening on %s", self.address)
+
+    async def stop(self) -> None:
+        """Stop serving requests."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> OeloSimulator:
+        """Start the simulator for the duration of a block."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Stop the simulator at the end of a block."""
+        await self.stop()
+
+    def reset(self) -> None:
+        """Turn every zone off and clear the counters."""
+        for num in self.zones:
+            self.zones[num] = _initial_zone(num)
+        self.stats = SimulatorStats()
+
+    async def _async_serve(
+        self, request: web.Request, latency: float
+    ) -> bool:
+        """Wait for the connection slot and the response delay.
+
+        Returns False when the request should be dropped.
+        """
+        self._waiting += 1
+        self.stats.max_waiting = max(self.stats.max_waiting, self._waiting)
+        if self._busy.locked():
+            self.stats.queued += 1
+        try:
+            async with self._busy:
+                delay = latency + self._random.uniform(-self.jitter, self.jitter)
+                await asyncio.sleep(max(0.0, delay))
+                if self.drop_rate and self._random.random() < self.drop_rate:
+                    self.stats.dropped += 1
+                    if request.transport is not None:
+                        request.transport.close()
+                    return False
+                return True
+        finally:
+            self._waiting -= 1
+
+    async def _handle_get_controller(self, request: web.Request) -> web.StreamResponse:
+        """Return the state of every zone."""
+        self.stats.polls += 1
+        if not await self._async_serve(request, self.poll_latency):
+            return web.Response(status=503)
+        return web.json_response(list(self.zones.values()))
+
+    async def _handle_set_pattern(self, request: web.Request) -> web.StreamResponse:
+        """Apply a pattern to the zones listed in the request."""
+        self.stats.commands += 1
+        query = request.query
+        try:
+            zones = [int(z) for z in query["zones"].split(",") if z]
+            pattern = query["patternType"]
+            colors = query.get("colors", "")
+            speed = int(query.get("speed", 0))
+            gap = int(query.get("gap", 0))
+        except (KeyError, ValueError):
+            return web.Response(status=400, text="invalid command")
+        if not await self._async_serve(request, self.command_latency):
+            return web.Response(status=503)
+        for num in zones:
+            if num not in self.zones:
+                continue
+            self.zones[num].update(
+                pattern=pattern,
+                colorStr=colors,
+                speed=speed,
+                gap=gap,
+                direction=query.get("direction", "F"),
+            )
+            self.stats.commands_per_zone[num] = (
+                self.stats.commands_per_zone.get(num, 0) + 1
+            )
+        return web.Response(text="Command received")
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    """Run a simulator until interrupted."""
+    simulator = OeloSimulator(
+        args.host,
+        args.port,
+        num_zones=args.zones,
+        poll_latency=args.poll_latency,
+        command_latency=args.command_latency,
+        jitter=args.jitter,
+        drop_rate=args.drop_rate,
+        seed=args.seed,
+    )
+    async with simulator:
+        try:
+            await asyncio.Event().wait()
+        finally:
+            _LOGGER.info("Served %s", simulator.stats.as_dict())
+
+
+def main() -> None:
+    """Parse arguments and run the simulator."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--zones", type=int, default=NUM_ZONES)
+    parser.add_argument("--poll-latency", type=float, default=DEFAULT_POLL_LATENCY)
+    parser.add_argument(
+        "--command-latency", type=float, default=DEFAULT_COMMAND_LATENCY
+    )
+    parser.add_argument("--jitter", type=float, default=DEFAULT_JITTER)
+    parser.add_argument(
+        "--drop-rate",
+        type=float,
+        default=0.0,
+        help="fraction of requests to drop without a response",
+    )
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    try:
+        asyncio.run(_async_main(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()